@@ -0,0 +1 @@
+"""Benchmarks des algorithmes des exercices (voir python -m benchmarks --help)."""
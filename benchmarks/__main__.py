@@ -0,0 +1,49 @@
+import argparse
+import sys
+
+from benchmarks import suite
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmarks des algorithmes des exercices, de 10^3 à 10^7 éléments.")
+    parser.add_argument("-k", "--filter", help="n'exécute que les benchmarks dont le nom contient ce texte")
+    parser.add_argument("--min-size", type=float, default=1e3)
+    parser.add_argument("--max-size", type=float, default=1e7)
+    parser.add_argument("--min-time", type=float, default=0.2, help="durée cumulée minimale par mesure (s)")
+    parser.add_argument("--save", metavar="FICHIER.json", help="enregistre les résultats (référence)")
+    parser.add_argument("--compare", metavar="FICHIER.json", help="compare aux résultats de référence")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="ralentissement relatif toléré avant de signaler une régression (défaut : 0.2)")
+    parser.add_argument("--list", action="store_true", help="liste les benchmarks disponibles")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, (_, max_size) in suite.BENCHMARKS.items():
+            print(f"{name}  (taille max : {max_size or max(suite.DEFAULT_SIZES):.0e})")
+        return 0
+
+    sizes = [size for size in suite.DEFAULT_SIZES if args.min_size <= size <= args.max_size]
+    results = suite.run(sizes, args.filter, args.min_time)
+
+    print("\nExposants d'échelle (1 : linéaire)")
+    for name, entries in results["results"].items():
+        exponents = suite.scaling_exponents(entries)
+        if exponents:
+            print(f"  {name:<52} " + "  ".join(f"{k}: {v:.2f}" for k, v in exponents.items()))
+
+    if args.save:
+        suite.save(results, args.save)
+
+    if args.compare:
+        rows, regressions = suite.compare(suite.load(args.compare), results, args.threshold)
+        print(f"\nComparaison avec {args.compare} (seuil : +{args.threshold:.0%})")
+        for name, size, old, new, ratio in rows:
+            flag = "  RÉGRESSION" if ratio > 1 + args.threshold else ""
+            print(f"  {name:<52} {size:>10}  {old * 1000:10.3f} -> {new * 1000:10.3f} ms  x{ratio:.2f}{flag}")
+        if regressions:
+            print(f"{len(regressions)} régression(s) détectée(s)")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+import json
+import math
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from core import fov, maze, mesh_adjacency, mesh_lod, mesh_normals, path_analysis, vector_math
+from core.vector_math import to_vector3_list
+
+# Tailles par défaut : de 10^3 à 10^7
+DEFAULT_SIZES = [10 ** exponent for exponent in range(3, 8)]
+
+BENCHMARKS = {}
+
+def benchmark(name, max_size=None):
+    """Enregistre une fonction de préparation : setup(size) retourne la fonction à chronométrer."""
+    def register(setup):
+        BENCHMARKS[name] = (setup, max_size)
+        return setup
+    return register
+
+def random_vectors(size, seed=0):
+    return np.random.default_rng(seed).normal(size=(size, 3))
+
+def random_path(size, seed=0):
+    """Chemin synthétique sur grille (pas unitaires selon x ou z), sans passer par le générateur."""
+    rng = np.random.default_rng(seed)
+    steps = np.zeros((size - 1, 3))
+    axes = rng.choice([0, 2], size=size - 1)
+    steps[np.arange(size - 1), axes] = rng.choice([-1.0, 1.0], size=size - 1)
+    return np.concatenate([np.zeros((1, 3)), np.cumsum(steps, axis=0)])
+
+def grid_mesh(face_count):
+    """Mesh synthétique : grille de n x n sommets ondulée, environ face_count triangles."""
+    n = max(2, int(math.sqrt(face_count / 2)) + 1)
+    x, z = np.meshgrid(np.linspace(-1, 1, n), np.linspace(-1, 1, n), indexing="ij")
+    vertices = np.stack([x, np.sin(3 * x) * np.cos(3 * z), z], axis=-1).reshape(-1, 3)
+    index = np.arange(n * n).reshape(n, n)
+    a, b, c, d = index[:-1, :-1], index[1:, :-1], index[:-1, 1:], index[1:, 1:]
+    faces = np.concatenate([np.stack([a, c, b], axis=-1).reshape(-1, 3),
+                            np.stack([b, c, d], axis=-1).reshape(-1, 3)])
+    return vertices, faces
+
+@benchmark("vector_math.cross_product_batch")
+def _(size):
+    a, b = random_vectors(size, 0), random_vectors(size, 1)
+    return lambda: vector_math.cross_product_batch(a, b)
+
+@benchmark("vector_math.vector_normalize_batch")
+def _(size):
+    a = random_vectors(size)
+    return lambda: vector_math.vector_normalize_batch(a)
+
+@benchmark("vector_math.vector_normalize", max_size=10 ** 5)
+def _(size):
+    vectors = to_vector3_list(random_vectors(size))
+    return lambda: [vector_math.vector_normalize(v) for v in vectors]
+
+@benchmark("maze.generate_maze_path_array", max_size=10 ** 6)
+def _(size):
+    taille_grille = int(math.sqrt(size)) + 2
+    return lambda: maze.generate_maze_path_array(size, taille_grille, seed=1)
+
+@benchmark("path_analysis.check_turn_directions")
+def _(size):
+    points = random_path(size)
+    return lambda: path_analysis.check_turn_directions(points)
+
+@benchmark("path_analysis.check_turn_direction", max_size=10 ** 5)
+def _(size):
+    points = to_vector3_list(random_path(size))
+    return lambda: [path_analysis.check_turn_direction(points[i - 1], points[i], points[i + 1])
+                    for i in range(1, len(points) - 1)]
+
+@benchmark("fov.is_point_in_fov_batch")
+def _(size):
+    points = np.random.default_rng(0).uniform(-10, 10, size=(size, 3))
+    return lambda: fov.is_point_in_fov_batch((0, 0, 0), (0, 0, 1), 5, 90, points)
+
+@benchmark("fov.is_point_in_fov", max_size=10 ** 5)
+def _(size):
+    points = to_vector3_list(np.random.default_rng(0).uniform(-10, 10, size=(size, 3)))
+    position, direction = to_vector3_list([(0, 0, 0), (0, 0, 1)])
+    return lambda: [fov.is_point_in_fov(position, direction, 5, 90, point) for point in points]
+
+@benchmark("mesh_normals.compute_face_normals_array")
+def _(size):
+    vertices, faces = grid_mesh(size)
+    return lambda: mesh_normals.compute_face_normals_array(vertices, faces)
+
+@benchmark("mesh_adjacency.MeshAdjacency")
+def _(size):
+    vertices, faces = grid_mesh(size)
+    return lambda: mesh_adjacency.MeshAdjacency(faces, len(vertices))
+
+@benchmark("mesh_lod.cluster_decimate")
+def _(size):
+    vertices, faces = grid_mesh(size)
+    cell_size = 4 * float(np.linalg.norm(vertices[faces[0, 1]] - vertices[faces[0, 0]]))
+    return lambda: mesh_lod.cluster_decimate(vertices, faces, cell_size)
+
+def _register_vertex_normal_benchmarks():
+    """Un benchmark par mode de pondération, le mode étant lié à la création de chaque fonction."""
+    for mode in mesh_normals.VERTEX_NORMAL_MODES:
+        def setup(size, mode=mode):
+            vertices, faces = grid_mesh(size)
+            return lambda: mesh_normals.compute_vertex_normals_array(vertices, faces, mode)
+        benchmark(f"mesh_normals.compute_vertex_normals_array[{mode}]")(setup)
+
+_register_vertex_normal_benchmarks()
+
+def time_call(function, min_time=0.2, max_repeat=20):
+    """Exécute function au moins une fois, jusqu'à min_time secondes cumulées ; retourne les durées."""
+    durations = []
+    total = 0.0
+    while not durations or (total < min_time and len(durations) < max_repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+        total += durations[-1]
+    return durations
+
+def run(sizes=DEFAULT_SIZES, name_filter=None, min_time=0.2, log=print):
+    """
+    Exécute les benchmarks (filtrés par sous-chaîne) pour chaque taille autorisée.
+
+    :return: Résultats sérialisables : {"meta": ..., "results": {nom: {taille: {"min", "median", "repeat"}}}}.
+    """
+    results = {}
+    for name, (setup, max_size) in BENCHMARKS.items():
+        if name_filter and name_filter not in name:
+            continue
+        for size in sizes:
+            if max_size is not None and size > max_size:
+                continue
+            function = setup(size)
+            durations = time_call(function, min_time)
+            entry = {"min": min(durations), "median": statistics.median(durations), "repeat": len(durations)}
+            results.setdefault(name, {})[str(size)] = entry
+            log(f"{name:<52} {size:>10}  {entry['min'] * 1000:10.3f} ms  {entry['min'] / size * 1e9:9.2f} ns/élément")
+    meta = {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+    return {"meta": meta, "results": results}
+
+def scaling_exponents(entries):
+    """Exposants d'échelle entre tailles consécutives (1 : linéaire)."""
+    sizes = sorted(entries, key=int)
+    return {f"{a}->{b}": math.log(entries[b]["min"] / entries[a]["min"]) / math.log(int(b) / int(a))
+            for a, b in zip(sizes, sizes[1:])}
+
+def compare(baseline, current, threshold=0.2):
+    """
+    Compare deux résultats de run() (temps minimaux) pour les couples (nom, taille) communs.
+
+    :param threshold: Ralentissement relatif toléré (0.2 : 20 %).
+    :return: Liste de tuples (nom, taille, ancien temps, nouveau temps, rapport), et liste des régressions.
+    """
+    rows = []
+    regressions = []
+    for name, entries in current["results"].items():
+        for size, entry in entries.items():
+            reference = baseline["results"].get(name, {}).get(size)
+            if reference is None:
+                continue
+            ratio = entry["min"] / reference["min"]
+            row = (name, int(size), reference["min"], entry["min"], ratio)
+            rows.append(row)
+            if ratio > 1 + threshold:
+                regressions.append(row)
+    return rows, regressions
+
+def save(results, path):
+    with open(path, "w") as file:
+        json.dump(results, file, indent=1)
+
+def load(path):
+    with open(path) as file:
+        return json.load(file)
@@ -0,0 +1,45 @@
+"""Fonctions partagées entre les exercices (calcul vectoriel, géométrie, ...).
+
+Les noms ci-dessous sont exposés à la demande : ``import core`` ne charge ni
+numpy, ni pyray, ni trimesh tant qu'aucun de ces noms n'est utilisé, ce qui
+garde le démarrage des outils sans affichage (benchmarks, conversion PLY) rapide.
+"""
+import importlib
+
+_EXPORTS = {
+    "core.vector_math": (
+        "cross_product", "dot_product", "vector_length", "vector_normalize", "rotate_vector_y",
+        "cross_product_batch", "dot_product_batch", "vector_length_batch", "vector_normalize_batch",
+    ),
+    "core.path_analysis": ("PathAnalysis", "check_turn_direction", "check_turn_directions"),
+    "core.maze": ("generate_maze_path", "generate_maze_path_array", "generate_maze_paths", "iter_maze_path"),
+    "core.fov": ("is_point_in_fov", "is_point_in_fov_batch", "iter_fov_visibility"),
+    "core.mesh_normals": ("compute_face_normals_array", "compute_vertex_normals_array"),
+    "core.mesh_adjacency": ("MeshAdjacency",),
+    "core.mesh_lod": ("build_lod_pyramid", "load_or_build_lod_pyramid", "cluster_decimate"),
+    "core.ply_io": ("read_ply", "write_ply_binary"),
+    "core.mesh_stream": ("PlyStream", "stream_mesh_normals"),
+    "core.normals_cache": ("load_or_compute_normals",),
+    "core.rendering": ("initialize_camera", "update_camera_position", "draw_vector_3", "draw_text_if_visible_3"),
+    "core.labels": ("draw_labels", "project_labels", "LabelDeclutter", "LABEL_STATS"),
+    "core.projection": ("Frustum", "project_to_screen"),
+    "core.culling": ("CullingHierarchy", "morton_order"),
+    "core.draw_backend": ("get_backend", "use_backend"),
+    "core.frame_profiler": ("FrameProfiler", "DISABLED_PROFILER"),
+}
+
+_NAME_TO_MODULE = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_NAME_TO_MODULE)
+
+def __getattr__(name):
+    """Importe le sous-module qui définit ``name`` au premier accès."""
+    module = _NAME_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module 'core' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,150 @@
+import numpy as np
+
+from core.draw_backend import get_backend
+from core.mesh_buffer import upload_triangles
+from core.vector_math import cross_product_batch, vector_length_batch, vector_normalize_batch
+
+def decimate(count, max_count):
+    """Indices d'un sous-échantillonnage régulier d'au plus max_count éléments parmi count."""
+    if max_count is None or count <= max_count:
+        return np.arange(count)
+    step = -(-count // max(max_count, 1))
+    return np.arange(0, count, step)
+
+def _orthonormal_basis(directions):
+    """Deux vecteurs unitaires (u, v) perpendiculaires à chaque direction unitaire, avec u x v = direction."""
+    helper = np.zeros_like(directions)
+    use_x = np.abs(directions[:, 0]) < 0.9
+    helper[use_x, 0] = 1
+    helper[~use_x, 1] = 1
+    u = vector_normalize_batch(cross_product_batch(directions, helper))
+    v = cross_product_batch(directions, u)
+    return u, v
+
+def build_arrow_triangles(starts, directions, thickness=0.05, head_size_factor=0.8, sides=8):
+    """
+    Construit en une passe vectorisée la géométrie de N flèches (même forme que draw_vector_3 :
+    un cylindre de rayon thickness / 2 et une tête conique de rayon thickness * 2 à thickness / 5
+    commençant à head_size_factor de la longueur). Les vecteurs de longueur nulle sont ignorés.
+
+    :param starts: Origines des flèches (N, 3).
+    :param directions: Vecteurs des flèches (N, 3) : l'extrémité est start + direction.
+    :param sides: Nombre de côtés des cylindres.
+    :return: Tampon de triangles (K * 3, 3) float32.
+    """
+    starts = np.asarray(starts, dtype=np.float32)
+    directions = np.asarray(directions, dtype=np.float32)
+    lengths = vector_length_batch(directions)
+    keep = lengths > 0
+    starts, directions, lengths = starts[keep], directions[keep], lengths[keep]
+    unit = directions / lengths[:, np.newaxis]
+    u, v = _orthonormal_basis(unit)
+    ends = starts + directions
+    head_starts = starts + unit * (lengths * head_size_factor)[:, np.newaxis]
+
+    angles = np.linspace(0, 2 * np.pi, sides, endpoint=False, dtype=np.float32)
+    ring = (np.cos(angles)[np.newaxis, :, np.newaxis] * u[:, np.newaxis]
+            + np.sin(angles)[np.newaxis, :, np.newaxis] * v[:, np.newaxis])    # (N, sides, 3)
+
+    def ring_at(centers, radius):
+        return centers[:, np.newaxis] + ring * np.float32(radius)
+
+    shaft_bottom = ring_at(starts, thickness / 2)
+    shaft_top = ring_at(ends, thickness / 2)
+    head_bottom = ring_at(head_starts, thickness * 2)
+    head_top = ring_at(ends, thickness / 5)
+
+    following = np.roll(np.arange(sides), -1)
+
+    def side_triangles(bottom, top):
+        # Deux triangles par côté, orientés vers l'extérieur
+        b0, b1, t0, t1 = bottom, bottom[:, following], top, top[:, following]
+        return np.stack([b0, b1, t0, b1, t1, t0], axis=2).reshape(len(bottom), 6 * sides, 3)
+
+    center = np.broadcast_to(head_starts[:, np.newaxis], head_bottom.shape)
+    cap = np.stack([center, head_bottom[:, following], head_bottom], axis=2).reshape(len(head_bottom), 3 * sides, 3)
+
+    triangles = np.concatenate([side_triangles(shaft_bottom, shaft_top),
+                                side_triangles(head_bottom, head_top), cap], axis=1)
+    return triangles.reshape(-1, 3)
+
+def build_arrow_lines(starts, directions):
+    """
+    Version économique : un segment par flèche, codé comme un triangle dégénéré (start, end, end)
+    à dessiner en mode fil de fer.
+
+    :return: Tampon de triangles (N * 3, 3) float32.
+    """
+    starts = np.asarray(starts, dtype=np.float32)
+    ends = starts + np.asarray(directions, dtype=np.float32)
+    return np.stack([starts, ends, ends], axis=1).reshape(-1, 3)
+
+class ArrowField:
+    """
+    Champ de flèches (normales, vecteurs, ...) regroupé dans un seul tampon envoyé au GPU :
+    un appel de dessin par image, quel que soit le nombre de flèches.
+    Au-delà de max_arrows flèches, un sous-échantillon régulier est affiché.
+
+    :param style: "arrows" (cylindres et cônes) ou "lines" (segments, beaucoup plus légers).
+    :param segments: Indices de début (croissants) de blocs de flèches consécutives, par exemple
+                     CullingHierarchy.chunk_starts ; chaque bloc est alors un modèle séparé
+                     que draw peut ignorer.
+    """
+
+    def __init__(self, starts, directions, thickness=0.05, head_size_factor=0.8, max_arrows=20000,
+                 style="arrows", sides=8, segments=None):
+        if style not in ("arrows", "lines"):
+            raise ValueError(f"style de flèche inconnu : {style!r}")
+        indices = decimate(len(starts), max_arrows)
+        starts = np.asarray(starts)[indices]
+        directions = np.asarray(directions)[indices]
+        self.style = style
+        self.arrow_count = len(indices)
+        if style == "arrows":
+            self.positions = build_arrow_triangles(starts, directions, thickness, head_size_factor, sides)
+            # build_arrow_triangles ignore les flèches de longueur nulle (même test, en float32)
+            kept = vector_length_batch(np.asarray(directions, dtype=np.float32)) > 0
+        else:
+            self.positions = build_arrow_lines(starts, directions)
+            kept = np.ones(self.arrow_count, dtype=bool)
+        # Bornes des blocs dans le tampon, après sous-échantillonnage : chaque flèche gardée
+        # occupe le même nombre de sommets
+        kept_before = np.concatenate([[0], np.cumsum(kept)])
+        vertices_per_arrow = len(self.positions) // max(int(kept_before[-1]), 1)
+        if segments is None:
+            segments = [0]
+        first_arrows = np.append(np.searchsorted(indices, segments), self.arrow_count)
+        bounds = kept_before[first_arrows] * vertices_per_arrow
+        self.segment_bounds = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+        self.models = None
+
+    def draw(self, color, segments=None):
+        """
+        Dessine les flèches (envoi au GPU au premier appel).
+        :param segments: Indices des blocs à dessiner (tous par défaut).
+        """
+        pr = get_backend()
+
+        if not len(self.positions):
+            return
+        if self.models is None:
+            self.models = [upload_triangles(self.positions[start:stop]) if stop > start else None
+                           for start, stop in self.segment_bounds]
+        models = self.models if segments is None else [self.models[i] for i in segments]
+        origin = pr.Vector3(0, 0, 0)
+        for model in models:
+            if model is None:
+                continue
+            if self.style == "arrows":
+                pr.draw_model(model, origin, 1.0, color)
+            else:
+                pr.draw_model_wires(model, origin, 1.0, color)
+
+    def unload(self):
+        """Libère les modèles du GPU."""
+        pr = get_backend()
+
+        for model in self.models or ():
+            if model is not None:
+                pr.unload_model(model)
+        self.models = None
@@ -0,0 +1,186 @@
+import numpy as np
+
+def _spread_bits(values):
+    """Intercale deux bits nuls entre chaque bit des entiers (10 bits) pour former un code de Morton."""
+    values = values.astype(np.uint32) & 0x3FF
+    values = (values | (values << 16)) & 0x030000FF
+    values = (values | (values << 8)) & 0x0300F00F
+    values = (values | (values << 4)) & 0x030C30C3
+    values = (values | (values << 2)) & 0x09249249
+    return values
+
+def morton_order(points):
+    """
+    Ordonne des points (N, 3) le long d'une courbe de Morton (ordre Z) sur une grille de 1024^3 cellules,
+    pour que des points voisins dans l'espace soient voisins dans le tableau.
+
+    :return: Permutation (N,) des indices.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if not len(points):
+        return np.zeros(0, dtype=np.intp)
+    low = points.min(axis=0)
+    extent = points.max(axis=0) - low
+    extent[extent == 0] = 1.0
+    cells = ((points - low) / extent * 1023).astype(np.uint32)
+    codes = _spread_bits(cells[:, 0]) | (_spread_bits(cells[:, 1]) << 1) | (_spread_bits(cells[:, 2]) << 2)
+    return np.argsort(codes, kind="stable")
+
+def default_chunk_size(count, target_chunks=256, minimum=1024):
+    """Taille de bloc donnant environ target_chunks blocs, sans descendre sous minimum primitives."""
+    return max(minimum, -(-count // target_chunks))
+
+def _normal_cones(normals, starts):
+    """
+    Calcule, pour chaque bloc, un cône contenant toutes ses normales.
+
+    :return: (axes (C, 3), sinus du demi-angle (C,), validité (C,)). Un cône est invalide
+             (aucun rejet possible) si son demi-angle atteint 90° ou si une normale est nulle.
+    """
+    axes = np.add.reduceat(normals, starts, axis=0)
+    lengths = np.linalg.norm(axes, axis=1, keepdims=True)
+    axes = np.divide(axes, lengths, out=np.zeros_like(axes), where=lengths > 0)
+    counts = np.diff(np.append(starts, len(normals)))
+    dots = np.einsum("ij,ij->i", normals, np.repeat(axes, counts, axis=0))
+    cos_spread = np.minimum.reduceat(dots, starts)
+    valid = cos_spread > 0
+    sin_spread = np.sqrt(np.clip(1.0 - cos_spread ** 2, 0.0, 1.0))
+    return axes, sin_spread, valid
+
+def _merge_cones(axes, sin_spread, valid, starts):
+    """Calcule les cônes englobant des groupes consécutifs de cônes."""
+    group_axes = np.add.reduceat(axes, starts, axis=0)
+    lengths = np.linalg.norm(group_axes, axis=1, keepdims=True)
+    group_axes = np.divide(group_axes, lengths, out=np.zeros_like(group_axes), where=lengths > 0)
+    counts = np.diff(np.append(starts, len(axes)))
+    offsets = np.arccos(np.clip(np.einsum("ij,ij->i", axes, np.repeat(group_axes, counts, axis=0)), -1.0, 1.0))
+    angles = np.where(valid, offsets + np.arcsin(sin_spread), np.pi)
+    group_angles = np.maximum.reduceat(angles, starts)
+    group_valid = group_angles < np.pi / 2
+    return group_axes, np.sin(np.minimum(group_angles, np.pi / 2)), group_valid
+
+class _Level:
+    """Boîtes englobantes, sphères et cônes de normales d'un niveau de la hiérarchie."""
+
+    def __init__(self, mins, maxs, axes, sin_spread, cone_valid):
+        self.mins = mins
+        self.maxs = maxs
+        self.centers = (mins + maxs) / 2
+        self.radii = np.linalg.norm(maxs - mins, axis=1) / 2
+        self.axes = axes
+        self.sin_spread = sin_spread
+        self.cone_valid = cone_valid
+
+    def culled(self, frustum, backface, selection=slice(None)):
+        """Indique, pour les éléments sélectionnés, s'ils sont hors du volume de vue ou entièrement de dos."""
+        mins, maxs = self.mins[selection], self.maxs[selection]
+        outside = frustum.boxes_outside(mins, maxs)
+        if not backface:
+            return outside
+        axes, sin_spread = self.axes[selection], self.sin_spread[selection]
+        if frustum.orthographic:
+            # Direction de vue constante : toutes les normales s'éloignent de la caméra
+            back = axes @ frustum.direction >= sin_spread
+        else:
+            # Test du cône de normales, conservateur sur toute la sphère englobante du bloc
+            to_center = self.centers[selection] - frustum.eye
+            distances = np.linalg.norm(to_center, axis=1)
+            radii = self.radii[selection]
+            back = np.einsum("ij,ij->i", axes, to_center) >= sin_spread * distances + radii * (1 + sin_spread)
+        return outside | (back & self.cone_valid[selection])
+
+class CullingHierarchy:
+    """
+    Hiérarchie de boîtes englobantes à deux niveaux (groupes de blocs, puis blocs de primitives consécutives)
+    servant à éliminer, avant le dessin, les blocs hors du volume de vue ou entièrement tournés vers l'arrière.
+    Seuls les blocs des groupes retenus sont testés : le coût par image dépend du nombre de blocs visibles,
+    pas du nombre de faces.
+
+    Les primitives doivent être ordonnées de façon spatialement cohérente (voir morton_order),
+    dans le même ordre que les tampons dessinés (GpuMesh(face_order=...)).
+
+    :param mins: Coins minimaux des primitives (N, 3), dans l'ordre de dessin.
+    :param maxs: Coins maximaux des primitives (N, 3).
+    :param normals: Normales unitaires des primitives (N, 3), ou None pour désactiver le rejet des faces arrière.
+    :param chunk_size: Nombre de primitives par bloc (doit correspondre aux blocs dessinés).
+    :param group_size: Nombre de blocs par groupe.
+    :param padding: Marge ajoutée aux boîtes (par exemple la longueur des flèches de normales).
+    """
+
+    def __init__(self, mins, maxs, normals=None, chunk_size=4096, group_size=32, padding=0.0):
+        mins = np.asarray(mins, dtype=np.float64)
+        maxs = np.asarray(maxs, dtype=np.float64)
+        self.count = len(mins)
+        self.chunk_size = chunk_size
+        self.chunk_starts = np.arange(0, self.count, chunk_size)
+        self.group_size = group_size
+        if not self.count:
+            self.chunks = self.groups = None
+            return
+
+        chunk_mins = np.minimum.reduceat(mins, self.chunk_starts, axis=0) - padding
+        chunk_maxs = np.maximum.reduceat(maxs, self.chunk_starts, axis=0) + padding
+        if normals is not None:
+            axes, sin_spread, valid = _normal_cones(np.asarray(normals, dtype=np.float64), self.chunk_starts)
+        else:
+            axes = np.zeros_like(chunk_mins)
+            sin_spread = np.ones(len(chunk_mins))
+            valid = np.zeros(len(chunk_mins), dtype=bool)
+        self.chunks = _Level(chunk_mins, chunk_maxs, axes, sin_spread, valid)
+
+        group_starts = np.arange(0, len(chunk_mins), group_size)
+        self.groups = _Level(
+            np.minimum.reduceat(chunk_mins, group_starts, axis=0),
+            np.maximum.reduceat(chunk_maxs, group_starts, axis=0),
+            *_merge_cones(axes, sin_spread, valid, group_starts),
+        )
+
+    @classmethod
+    def from_faces(cls, vertices, faces, face_normals=None, face_order=None, **options):
+        """
+        Construit la hiérarchie des faces triangulaires d'un mesh.
+
+        :param vertices: Sommets (V, 3).
+        :param faces: Faces (F, 3).
+        :param face_normals: Normales des faces (F, 3), dans l'ordre d'origine.
+        :param face_order: Ordre de dessin des faces (le même que celui passé à GpuMesh).
+        :param options: Paramètres de CullingHierarchy (chunk_size, group_size, padding).
+        """
+        faces = np.asarray(faces)
+        if face_order is not None:
+            faces = faces[face_order]
+            if face_normals is not None:
+                face_normals = np.asarray(face_normals)[face_order]
+        corners = np.asarray(vertices)[faces]
+        return cls(corners.min(axis=1), corners.max(axis=1), face_normals, **options)
+
+    @classmethod
+    def from_points(cls, points, normals=None, order=None, **options):
+        """Construit la hiérarchie de points (sommets, origines de flèches), avec leurs normales éventuelles."""
+        points = np.asarray(points)
+        if order is not None:
+            points = points[order]
+            if normals is not None:
+                normals = np.asarray(normals)[order]
+        return cls(points, points, normals, **options)
+
+    @property
+    def chunk_count(self):
+        return len(self.chunk_starts)
+
+    def visible_chunks(self, frustum, backface=True):
+        """
+        Sélectionne les blocs potentiellement visibles pour une image.
+
+        :param frustum: Volume de vue de la caméra (core.projection.Frustum).
+        :param backface: Rejeter aussi les blocs dont toutes les primitives sont de dos.
+        :return: Indices des blocs à dessiner, triés.
+        """
+        if not self.count:
+            return np.zeros(0, dtype=np.intp)
+        kept_groups = np.flatnonzero(~self.groups.culled(frustum, backface))
+        if not len(kept_groups):
+            return np.zeros(0, dtype=np.intp)
+        candidates = (kept_groups[:, np.newaxis] * self.group_size + np.arange(self.group_size)).ravel()
+        candidates = candidates[candidates < self.chunk_count]
+        return candidates[~self.chunks.culled(frustum, backface, candidates)]
@@ -0,0 +1,186 @@
+import argparse
+import importlib
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# Préfixes des fonctions pyray qui dépendent de la fenêtre ou du GPU : elles sont
+# enregistrées (et simulées) par RecordingBackend ; les autres (Vector3, couleurs,
+# constantes, vector3_add, ffi, ...) sont transmises à pyray.
+RECORDED_PREFIXES = ("draw_", "begin_", "end_", "clear_", "init_", "close_", "set_", "get_", "is_",
+                     "window_", "load_", "unload_", "upload_", "update_", "rl_", "poll_", "swap_", "mem_")
+
+_current_backend = None
+
+def get_backend():
+    """Retourne le backend de dessin courant (le module pyray par défaut)."""
+    global _current_backend
+    if _current_backend is None:
+        import pyray
+        _current_backend = pyray
+    return _current_backend
+
+@contextmanager
+def use_backend(backend, *modules):
+    """
+    Remplace temporairement le backend de dessin : backend courant de get_backend() et
+    attribut pr des modules donnés (exo1, exo2, ...).
+    """
+    global _current_backend
+    previous = _current_backend
+    previous_modules = [(module, module.pr) for module in modules]
+    _current_backend = backend
+    for module in modules:
+        module.pr = backend
+    try:
+        yield backend
+    finally:
+        _current_backend = previous
+        for module, pr in previous_modules:
+            module.pr = pr
+
+class FrameRecord:
+    """Appels de dessin d'une image (entre begin_drawing et end_drawing) et temps CPU associé."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.arguments = Counter()
+        self.cpu_time = 0.0
+        self.wall_time = 0.0
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+class RecordingBackend:
+    """
+    Backend de dessin sans fenêtre : s'utilise à la place du module pyray (voir use_backend).
+    Chaque appel d'une fonction dépendant de la fenêtre ou du GPU est compté (nombre d'appels
+    et d'arguments) au lieu d'être exécuté ; mem_alloc retourne de la mémoire gérée par Python,
+    si bien qu'aucune allocation native n'est faite. Les images sont délimitées par
+    begin_drawing / end_drawing et leur temps CPU est mesuré. window_should_close retourne
+    True après max_frames images.
+    """
+
+    def __init__(self, max_frames=60, screen_width=800, screen_height=600):
+        import pyray
+        self._pyray = pyray
+        self.max_frames = max_frames
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.frames = []
+        self.setup = FrameRecord()     # appels hors des images (initialisation, chargement)
+        self._frame = None
+        self._frame_start = None
+        self._stubs = {
+            "window_should_close": lambda *args: len(self.frames) >= self.max_frames,
+            "get_screen_width": lambda *args: self.screen_width,
+            "get_screen_height": lambda *args: self.screen_height,
+            "get_world_to_screen": lambda *args: pyray.Vector2(self.screen_width / 2, self.screen_height / 2),
+            "get_frame_time": lambda *args: 1 / 60,
+            "get_time": lambda *args: len(self.frames) / 60,
+            "load_model_from_mesh": lambda *args: pyray.Model(),
+            "mem_alloc": self._mem_alloc,
+            "mem_free": self._mem_free,
+            "begin_drawing": self._begin_frame,
+            "end_drawing": self._end_frame,
+        }
+        self._wrappers = {}
+        # Tampons alloués par mem_alloc (mémoire Python, libérée avec le backend) : aucune allocation native
+        self._allocations = {}
+
+    def __getattr__(self, name):
+        attribute = getattr(self._pyray, name)
+        if not (callable(attribute) and name.startswith(RECORDED_PREFIXES)):
+            return attribute
+        wrapper = self._wrappers.get(name)
+        if wrapper is None:
+            wrapper = self._wrappers[name] = self._make_recorder(name)
+        return wrapper
+
+    def _make_recorder(self, name):
+        stub = self._stubs.get(name)
+
+        def record(*args):
+            if name == "begin_drawing":
+                # L'image commence avant l'enregistrement de son premier appel
+                stub(*args)
+            frame = self._frame if self._frame is not None else self.setup
+            frame.calls[name] += 1
+            frame.arguments[name] += len(args)
+            if stub is not None and name != "begin_drawing":
+                return stub(*args)
+            if name.startswith(("get_", "is_")):
+                return 0 if name.startswith("get_") else False
+            return None
+        return record
+
+    def _mem_alloc(self, size, *args):
+        buffer = self._pyray.ffi.new("char[]", max(int(size), 1))
+        pointer = self._pyray.ffi.cast("void *", buffer)
+        self._allocations[int(self._pyray.ffi.cast("uintptr_t", pointer))] = buffer
+        return pointer
+
+    def _mem_free(self, pointer, *args):
+        self._allocations.pop(int(self._pyray.ffi.cast("uintptr_t", pointer)), None)
+
+    def _begin_frame(self, *args):
+        self._frame = FrameRecord()
+        self._frame_start = (time.process_time(), time.perf_counter())
+
+    def _end_frame(self, *args):
+        if self._frame is None:
+            return
+        cpu_start, wall_start = self._frame_start
+        self._frame.cpu_time = time.process_time() - cpu_start
+        self._frame.wall_time = time.perf_counter() - wall_start
+        self.frames.append(self._frame)
+        self._frame = None
+
+    def summary(self):
+        """Résumé des images enregistrées : appels par fonction et totaux moyens par image."""
+        calls = Counter()
+        arguments = Counter()
+        for frame in self.frames:
+            calls.update(frame.calls)
+            arguments.update(frame.arguments)
+        count = max(len(self.frames), 1)
+        return {
+            "frames": len(self.frames),
+            "calls_per_frame": sum(calls.values()) / count,
+            "cpu_ms_per_frame": 1000 * sum(frame.cpu_time for frame in self.frames) / count,
+            "wall_ms_per_frame": 1000 * sum(frame.wall_time for frame in self.frames) / count,
+            "calls": {name: calls[name] / count for name in sorted(calls)},
+            "arguments": {name: arguments[name] / count for name in sorted(arguments)},
+            "setup_calls": dict(self.setup.calls),
+        }
+
+def record_main(module, frames=60, **backend_options):
+    """
+    Exécute module.main() sans fenêtre pendant frames images et retourne le RecordingBackend.
+
+    :param module: Module d'exercice (exo1, ..., exo5) ou son nom.
+    """
+    if isinstance(module, str):
+        module = importlib.import_module(module)
+    backend = RecordingBackend(frames, **backend_options)
+    with use_backend(backend, module):
+        module.main()
+    return backend
+
+def main():
+    parser = argparse.ArgumentParser(description="Mesure du coût des images d'un exercice, sans fenêtre.")
+    parser.add_argument("module", help="module de l'exercice (exo1, ..., exo5)")
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    # Passe par le module importé (et non __main__) pour partager le backend courant avec core
+    from core import draw_backend
+    summary = draw_backend.record_main(args.module, args.frames).summary()
+    print(f"{summary['frames']} images : {summary['calls_per_frame']:.0f} appels, "
+          f"{summary['cpu_ms_per_frame']:.2f} ms CPU par image")
+    for name, count in sorted(summary["calls"].items(), key=lambda item: -item[1]):
+        print(f"  {name:<28} {count:10.1f} appels/image  {summary['arguments'][name] / max(count, 1):4.1f} arguments")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import math
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.vector_math import (as_vector_array, dot_product, vector3, vector_length, vector_normalize,
+                              vector_normalize_batch)
+
+def is_point_in_fov(fov_position, fov_direction, fov_distance, fov_angle, point):
+    """
+    Vérifie si un point est dans le champ de vision défini par une position, une direction, une distance et un angle.
+
+    :param fov_position: Position du point de départ de FOV.
+    :param fov_direction: Direction centrale du FOV.
+    :param fov_distance: Distance maximale de portée de la FOV.
+    :param fov_angle: Angle du FOV en degrés.
+    :param point: Point à vérifier.
+    :return: True si le point est dans le champ de vision, sinon False.
+    """
+    # Vecteur du FOV vers le point
+    to_point = vector3(point.x - fov_position.x, point.y - fov_position.y, point.z - fov_position.z)
+
+    # Calcule la distance au point et vérifie qu'elle est dans la distance FOV
+    dist_to_point = vector_length(to_point)
+    if fov_distance < dist_to_point:
+        return False
+
+    # Normalise la direction du FOV et le vecteur vers le point
+    norm_fov_direction = vector_normalize(fov_direction)
+    norm_to_point = vector_normalize(to_point)
+
+    # Calcule le produit scalaire (cosinus de l'angle entre la direction et le point)
+    cos_theta = dot_product(norm_fov_direction, norm_to_point)
+    if cos_theta < 0:
+        return False
+
+    # Calcule le cosinus de l'angle demi du FOV
+    cos_half_angle = math.cos(math.radians(fov_angle / 2))
+
+    # Vérifie si le produit scalaire satisfait la condition du FOV
+    return cos_theta >= cos_half_angle
+
+def is_point_in_fov_batch(fov_position, fov_direction, fov_distance, fov_angle, points):
+    """
+    Version vectorisée de is_point_in_fov pour un tableau de points.
+    Les tests utilisent la distance au carré et le cosinus de l'angle demi précalculé :
+    aucune racine carrée n'est calculée par point.
+
+    :param fov_position: Position du point de départ de FOV (Vector3 ou triplet).
+    :param fov_direction: Direction centrale du FOV (Vector3 ou triplet).
+    :param fov_distance: Distance maximale de portée de la FOV.
+    :param fov_angle: Angle du FOV en degrés.
+    :param points: Points à vérifier, tableau (N, 3) ou liste de Vector3.
+    :return: Masque booléen (N,), True pour les points dans le champ de vision.
+    """
+    points = as_vector_array(points, dtype=np.result_type(getattr(points, "dtype", np.float64), np.float32))
+    position = as_vector_array([fov_position])[0]
+    direction = as_vector_array([fov_direction])[0]
+    length = math.sqrt(direction @ direction)
+    if length != 0:
+        direction = direction / length
+    cos_half_angle = math.cos(math.radians(fov_angle / 2))
+
+    to_points = points - position.astype(points.dtype)
+    dist_sq = np.einsum("ij,ij->i", to_points, to_points)
+    dots = to_points @ direction.astype(points.dtype)
+
+    mask = dist_sq <= fov_distance * fov_distance
+    mask &= dots >= 0
+    if cos_half_angle > 0:
+        # dots / dist >= cos  <=>  dots² >= cos² * dist² (dots étant positif)
+        mask &= dots * dots >= (cos_half_angle * cos_half_angle) * dist_sq
+        # Un point confondu avec l'observateur n'a pas de direction : hors du champ
+        mask &= dist_sq > 0
+    return mask
+
+def check_fov_batch(fov_position, fov_direction, fov_distance, fov_angle, points, rtol=1e-5):
+    """
+    Compare is_point_in_fov_batch à is_point_in_fov point par point.
+    Les points situés sur une frontière (à la tolérance rtol près) sont ignorés.
+
+    :return: Indices des points pour lesquels les deux versions diffèrent.
+    """
+    points = as_vector_array(points)
+    mask = is_point_in_fov_batch(fov_position, fov_direction, fov_distance, fov_angle, points)
+
+    position = as_vector_array([fov_position])[0]
+    direction = as_vector_array([fov_direction])[0]
+    direction = direction / (np.linalg.norm(direction) or 1)
+    cos_half_angle = math.cos(math.radians(fov_angle / 2))
+
+    fov_position_3 = vector3(*position)
+    fov_direction_3 = vector3(*direction)
+    mismatches = []
+    for i, (x, y, z) in enumerate(points.tolist()):
+        expected = is_point_in_fov(fov_position_3, fov_direction_3, fov_distance, fov_angle, vector3(x, y, z))
+        if expected == bool(mask[i]):
+            continue
+        to_point = points[i] - position
+        dist = np.linalg.norm(to_point)
+        cos_theta = (to_point @ direction) / dist if dist else 0.0
+        on_boundary = (abs(dist - fov_distance) <= rtol * max(fov_distance, 1)
+                       or abs(cos_theta - cos_half_angle) <= rtol
+                       or abs(cos_theta) <= rtol)
+        if not on_boundary:
+            mismatches.append(i)
+    return np.array(mismatches, dtype=np.int64)
+
+def _prepare_observers(fov_positions, fov_directions, fov_distances, fov_angles):
+    """Prépare les paramètres par observateur : positions, directions unitaires, distances², cos et cos² de l'angle demi."""
+    positions = as_vector_array(fov_positions)
+    count = len(positions)
+    directions = vector_normalize_batch(np.broadcast_to(as_vector_array(fov_directions), (count, 3)))
+    distances = np.broadcast_to(np.asarray(fov_distances, dtype=np.float64), (count,))
+    cos_half = np.cos(np.radians(np.broadcast_to(np.asarray(fov_angles, dtype=np.float64), (count,)) / 2))
+    return positions, directions, distances * distances, cos_half, cos_half * cos_half
+
+def _fov_block_pairs(observers, targets, o_start, o_stop, t_start, t_stop):
+    """Calcule les couples (observateur, cible) visibles d'un bloc observateurs x cibles."""
+    positions, directions, dist_sq_max, cos_half, cos_sq = (array[o_start:o_stop] for array in observers)
+    to_targets = targets[np.newaxis, t_start:t_stop] - positions[:, np.newaxis]
+    dist_sq = np.einsum("otk,otk->ot", to_targets, to_targets)
+    dots = np.einsum("otk,ok->ot", to_targets, directions)
+
+    mask = dist_sq <= dist_sq_max[:, np.newaxis]
+    mask &= dots >= 0
+    # Même test que is_point_in_fov_batch, avec un angle par observateur
+    narrow = (cos_half > 0)[:, np.newaxis]
+    mask &= ~narrow | ((dots * dots >= cos_sq[:, np.newaxis] * dist_sq) & (dist_sq > 0))
+
+    observer_indices, target_indices = np.nonzero(mask)
+    return observer_indices + o_start, target_indices + t_start
+
+def _iter_blocks(observer_count, target_count, chunk_size):
+    """Découpe la relation observateurs x cibles en blocs d'au plus chunk_size couples."""
+    target_block = max(1, min(target_count, chunk_size))
+    observer_block = max(1, chunk_size // target_block)
+    for o_start in range(0, observer_count, observer_block):
+        o_stop = min(o_start + observer_block, observer_count)
+        for t_start in range(0, target_count, target_block):
+            yield o_start, o_stop, t_start, min(t_start + target_block, target_count)
+
+# Données partagées par les processus du pool (initialisées une fois par processus)
+_worker_data = None
+
+def _init_worker(observers, targets):
+    global _worker_data
+    _worker_data = (observers, targets)
+
+def _worker_block_pairs(block):
+    observers, targets = _worker_data
+    return _fov_block_pairs(observers, targets, *block)
+
+def iter_fov_visibility(fov_positions, fov_directions, fov_distances, fov_angles, targets,
+                        chunk_size=1 << 20, processes=None):
+    """
+    Calcule la relation de visibilité observateurs x cibles (même sémantique que is_point_in_fov)
+    sous forme creuse, par blocs d'au plus chunk_size couples testés : la mémoire utilisée ne
+    dépend pas du produit O x T.
+
+    :param fov_positions: Positions des observateurs (O, 3).
+    :param fov_directions: Directions des observateurs (O, 3) ou une direction commune.
+    :param fov_distances: Portées (O,) ou une portée commune.
+    :param fov_angles: Angles des FOV en degrés (O,) ou un angle commun.
+    :param targets: Cibles (T, 3).
+    :param chunk_size: Nombre maximal de couples testés par bloc.
+    :param processes: Nombre de processus pour répartir les blocs (None : calcul dans ce processus).
+    :return: Générateur de tuples (indices des observateurs, indices des cibles) des couples visibles.
+    """
+    observers = _prepare_observers(fov_positions, fov_directions, fov_distances, fov_angles)
+    targets = as_vector_array(targets)
+    blocks = _iter_blocks(len(observers[0]), len(targets), chunk_size)
+
+    if not processes:
+        for block in blocks:
+            yield _fov_block_pairs(observers, targets, *block)
+        return
+
+    with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(observers, targets)) as executor:
+        # Nombre de blocs en cours limité pour borner la mémoire
+        pending = deque()
+        for block in blocks:
+            pending.append(executor.submit(_worker_block_pairs, block))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def main():
+    rng = np.random.default_rng(0)
+    fov_position = (0.5, 0.0, -1.0)
+    fov_direction = (0.3, 0.0, 1.0)
+    fov_distance = 5
+    fov_angle = 90
+
+    # Vérification de la version vectorisée par rapport à la version scalaire
+    for angle in (30, 90, 179, 270):
+        points = rng.uniform(-8, 8, size=(20000, 3))
+        mismatches = check_fov_batch(fov_position, fov_direction, fov_distance, angle, points)
+        print(f"Angle {angle}° : {len(mismatches)} différence(s)")
+
+    # Mesure du temps pour 10^6 points
+    points = rng.uniform(-8, 8, size=(1_000_000, 3))
+    start = time.perf_counter()
+    is_point_in_fov_batch(fov_position, fov_direction, fov_distance, fov_angle, points)
+    print(f"10^6 points : {(time.perf_counter() - start) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import csv
+import json
+import os
+import time
+
+import numpy as np
+
+from core.draw_backend import get_backend
+
+class _Scope:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        current = self.profiler._current
+        current[self.name] = current.get(self.name, 0.0) + time.perf_counter() - self.start
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+_NULL_SCOPE = _NullScope()
+
+class FrameProfiler:
+    """
+    Mesure du temps passé dans des étapes nommées de la boucle de rendu (caméra, passe 3D,
+    texte, ...). Les durées des capacity dernières images sont conservées dans un tampon
+    circulaire de taille fixe, d'où sont tirés moyennes et percentiles.
+
+    Utilisation :
+        with profiler.scope("3d"):
+            ...
+        profiler.end_frame()
+    """
+
+    def __init__(self, capacity=600, enabled=True, output_path=None, overlay=False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.output_path = output_path
+        self.overlay = overlay
+        self.frame_count = 0
+        self._rings = {"frame": np.full(capacity, np.nan)}
+        self._current = {}
+        self._last_frame_end = None
+        self.overlay_refresh = 30
+        self._overlay_lines = None
+        self._overlay_frame = 0
+
+    @classmethod
+    def from_env(cls, capacity=600):
+        """
+        Crée un profileur configuré par l'environnement : OMM_PROFILE (chemin .csv ou .json
+        du rapport écrit à la fermeture) et OMM_PROFILE_OVERLAY (affichage à l'écran).
+        Sans ces variables, le profileur est désactivé et ne coûte rien.
+        """
+        output_path = os.environ.get("OMM_PROFILE") or None
+        overlay = os.environ.get("OMM_PROFILE_OVERLAY", "") not in ("", "0")
+        return cls(capacity, enabled=bool(output_path or overlay), output_path=output_path, overlay=overlay)
+
+    def scope(self, name):
+        """Contexte mesurant une étape ; les durées d'une même étape s'additionnent sur l'image."""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def end_frame(self):
+        """Clôt l'image courante et range ses durées dans les tampons circulaires."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        slot = self.frame_count % self.capacity
+        if self._last_frame_end is not None:
+            self._current["frame"] = now - self._last_frame_end
+        self._last_frame_end = now
+        for name, ring in self._rings.items():
+            ring[slot] = self._current.pop(name, np.nan)
+        for name, duration in self._current.items():
+            # Première apparition de l'étape
+            ring = self._rings[name] = np.full(self.capacity, np.nan)
+            ring[slot] = duration
+        self._current = {}
+        self.frame_count += 1
+
+    def _ordered(self, name):
+        """Durées (en secondes) d'une étape, de la plus ancienne à la plus récente image conservée."""
+        ring = self._rings[name]
+        if self.frame_count < self.capacity:
+            return ring[:self.frame_count]
+        slot = self.frame_count % self.capacity
+        return np.concatenate([ring[slot:], ring[:slot]])
+
+    def stats(self, percentiles=(50, 95, 99)):
+        """Statistiques en millisecondes par étape : moyenne, maximum et percentiles."""
+        result = {}
+        for name in self._rings:
+            values = self._ordered(name)
+            values = values[~np.isnan(values)] * 1000
+            if not len(values):
+                continue
+            entry = {"count": int(len(values)), "mean": float(values.mean()), "max": float(values.max())}
+            for q, value in zip(percentiles, np.percentile(values, percentiles)):
+                entry[f"p{q}"] = float(value)
+            result[name] = entry
+        return result
+
+    def draw_overlay(self, x=10, y=10, font_size=10, color=None):
+        """Affiche à l'écran la médiane et le 95e percentile de chaque étape (si overlay est activé)."""
+        if not (self.enabled and self.overlay):
+            return
+        pr = get_backend()
+        color = pr.DARKGRAY if color is None else color
+        # Les percentiles ne sont recalculés que toutes les overlay_refresh images
+        if self._overlay_lines is None or self.frame_count - self._overlay_frame >= self.overlay_refresh:
+            self._overlay_lines = [f"{name}: {entry['p50']:.2f} / {entry['p95']:.2f} ms"
+                                   for name, entry in self.stats((50, 95)).items()]
+            self._overlay_frame = self.frame_count
+        for line in self._overlay_lines:
+            pr.draw_text(line, x, y, font_size, color)
+            y += font_size + 2
+
+    def dump(self, path):
+        """Écrit les durées par image (CSV) ou les statistiques et durées (JSON), selon l'extension."""
+        names = list(self._rings)
+        columns = [self._ordered(name) * 1000 for name in names]
+        first_frame = self.frame_count - len(columns[0])
+        if path.endswith(".json"):
+            frames = [{name: (None if np.isnan(value) else float(value)) for name, value in zip(names, row)}
+                      for row in zip(*columns)]
+            with open(path, "w") as file:
+                json.dump({"first_frame": first_frame, "stats": self.stats(), "frames_ms": frames}, file, indent=1)
+            return
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame"] + [f"{name}_ms" for name in names])
+            for index, row in enumerate(zip(*columns)):
+                writer.writerow([first_frame + index] + ["" if np.isnan(value) else f"{value:.4f}" for value in row])
+
+    def close(self):
+        """Écrit le rapport dans output_path s'il est défini (à appeler en sortie de boucle)."""
+        if self.enabled and self.output_path:
+            self.dump(self.output_path)
+
+# Profileur inactif, valeur par défaut des fonctions de dessin instrumentées
+DISABLED_PROFILER = FrameProfiler(capacity=1, enabled=False)
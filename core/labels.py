@@ -0,0 +1,159 @@
+import logging
+import time
+
+import numpy as np
+
+from core.draw_backend import get_backend
+from core.projection import Frustum, camera_state
+from core.vector_math import as_vector_array
+
+logger = logging.getLogger(__name__)
+
+class LabelStats:
+    """
+    Compteurs des libellés dessinés et écartés (hors écran ou derrière la caméra).
+    Aucune écriture n'est faite à chaque image : un message de débogage (module logging)
+    résume au plus une fois toutes les log_interval secondes les libellés écartés depuis le précédent.
+    """
+
+    def __init__(self, log_interval=5.0):
+        self.drawn = 0
+        self.culled = 0
+        self.hidden = 0
+        self.log_interval = log_interval
+        self._culled_since_log = 0
+        self._last_log = time.monotonic()
+
+    def record(self, drawn, culled, hidden=0):
+        """
+        Ajoute les libellés d'une passe de dessin : dessinés, hors écran (culled)
+        et masqués par un libellé prioritaire de la même cellule (hidden).
+        """
+        self.drawn += drawn
+        self.culled += culled
+        self.hidden += hidden
+        self._culled_since_log += culled
+        now = time.monotonic()
+        if self._culled_since_log and now - self._last_log >= self.log_interval:
+            logger.debug("%d libellé(s) hors des limites de l'écran en %.1f s",
+                         self._culled_since_log, now - self._last_log)
+            self._culled_since_log = 0
+            self._last_log = now
+
+    def reset(self):
+        self.drawn = 0
+        self.culled = 0
+        self.hidden = 0
+        self._culled_since_log = 0
+
+# Compteurs partagés par défaut par draw_labels et draw_text_if_visible_3
+LABEL_STATS = LabelStats()
+
+def project_labels(camera, positions, width, height):
+    """
+    Projette en une fois les ancres de libellés à l'écran.
+
+    :param camera: Caméra utilisée pour le dessin.
+    :param positions: Ancres (N, 3), tableau ou liste de Vector3.
+    :param width: Largeur de l'écran en pixels.
+    :param height: Hauteur de l'écran en pixels.
+    :return: (positions entières à l'écran (N, 2), booléens (N,) des libellés visibles).
+    """
+    frustum = Frustum.from_camera(camera, width / height)
+    screen, visible = frustum.project(as_vector_array(positions), width, height)
+    return screen.astype(np.int64), visible
+
+def draw_labels(camera, texts, positions, font_size=20, color=None, stats=LABEL_STATS):
+    """
+    Dessine une série de libellés ancrés en 3D. Toutes les ancres sont projetées par un seul produit
+    matriciel (au lieu d'un appel pr.get_world_to_screen par libellé) et les libellés hors écran
+    sont écartés sans affichage ; seuls les visibles donnent lieu à un appel pr.draw_text.
+
+    :param camera: Caméra utilisée pour le dessin.
+    :param texts: Textes des libellés (N,).
+    :param positions: Ancres 3D (N, 3), tableau ou liste de Vector3.
+    :param font_size: Taille de la police du texte.
+    :param color: Couleur du texte (noir par défaut).
+    :param stats: Compteurs mis à jour (LabelStats), ou None.
+    :return: Nombre de libellés dessinés.
+    """
+    pr = get_backend()
+    color = pr.BLACK if color is None else color
+    screen, visible = project_labels(camera, positions, pr.get_screen_width(), pr.get_screen_height())
+    indices = np.flatnonzero(visible)
+    for index, (x, y) in zip(indices.tolist(), screen[indices].tolist()):
+        pr.draw_text(texts[index], x, y, font_size, color)
+    if stats is not None:
+        stats.record(len(indices), len(visible) - len(indices))
+    return len(indices)
+
+class LabelDeclutter:
+    """
+    Désencombrement des libellés : les libellés visibles sont répartis dans une grille de cellules à l'écran
+    (hachage spatial) et un seul libellé est gardé par cellule, le plus prioritaire. La sélection est
+    conservée tant que la caméra, la taille de l'écran et le nombre de libellés ne changent pas.
+
+    :param cell_size: Taille (largeur, hauteur) d'une cellule en pixels, de l'ordre de la taille d'un libellé.
+    """
+
+    def __init__(self, cell_size=(120, 24)):
+        self.cell_size = cell_size
+        self._key = None
+        self._selection = None
+
+    def invalidate(self):
+        """Force une nouvelle sélection à la prochaine image (ancres ou priorités modifiées)."""
+        self._key = None
+
+    def select(self, camera, positions, width, height, priorities=None):
+        """
+        Choisit les libellés à dessiner.
+
+        :param camera: Caméra utilisée pour le dessin.
+        :param positions: Ancres 3D (N, 3), tableau ou liste de Vector3.
+        :param width: Largeur de l'écran en pixels.
+        :param height: Hauteur de l'écran en pixels.
+        :param priorities: Priorités (N,) des libellés, la plus petite valeur l'emporte ; à priorité égale
+                           (ou sans priorités), le libellé le plus proche de la caméra l'emporte.
+        :return: (indices des libellés gardés (K,), positions entières à l'écran (K, 2), nombre de libellés visibles).
+        """
+        key = (camera_state(camera), width, height, len(positions))
+        if key == self._key:
+            return self._selection
+
+        positions = as_vector_array(positions)
+        frustum = Frustum.from_camera(camera, width / height)
+        screen, visible = frustum.project(positions, width, height)
+        indices = np.flatnonzero(visible)
+        cells = (screen[indices] // self.cell_size).astype(np.int64)
+        cell_keys = cells[:, 1] * (width // self.cell_size[0] + 2) + cells[:, 0]
+        distances = np.einsum("ij,ij->i", positions[indices] - frustum.eye, positions[indices] - frustum.eye)
+        sort_keys = (distances, cell_keys) if priorities is None else \
+            (distances, np.asarray(priorities)[indices], cell_keys)
+        order = np.lexsort(sort_keys)
+        # Premier libellé (le plus prioritaire) de chaque cellule
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = cell_keys[order[1:]] != cell_keys[order[:-1]]
+        kept = indices[np.sort(order[first])]
+
+        self._key = key
+        self._selection = (kept, screen[kept].astype(np.int64), len(indices))
+        return self._selection
+
+    def draw(self, camera, texts, positions, font_size=20, color=None, priorities=None, stats=LABEL_STATS):
+        """
+        Dessine au plus un libellé par cellule de l'écran (voir select).
+
+        :param texts: Textes des libellés (N,).
+        :param stats: Compteurs mis à jour (LabelStats), ou None.
+        :return: Nombre de libellés dessinés.
+        """
+        pr = get_backend()
+        color = pr.BLACK if color is None else color
+        kept, screen, visible_count = self.select(camera, positions, pr.get_screen_width(), pr.get_screen_height(),
+                                                  priorities)
+        for index, (x, y) in zip(kept.tolist(), screen.tolist()):
+            pr.draw_text(texts[index], x, y, font_size, color)
+        if stats is not None:
+            stats.record(len(kept), len(positions) - visible_count, visible_count - len(kept))
+        return len(kept)
@@ -0,0 +1,290 @@
+import math
+import operator
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.vector_math import to_vector3_list
+
+# Nombre d'étapes de recherche (avancées et reculs) autorisées par point du chemin demandé,
+# et nombre d'étapes par point avant de relancer une recherche qui s'enlise
+BACKTRACK_BUDGET = 64
+RESTART_STEPS = 4
+
+class MazeGrid:
+    """
+    Grille d'occupation dense pour la génération de chemins : (2 * taille_grille + 1) cellules
+    par axe (x, z en 2D ; x, y, z en 3D), centrées sur l'origine. Les cellules sont stockées
+    à plat dans un bytearray entouré d'une bordure occupée, ce qui évite tout test de limites.
+    """
+
+    def __init__(self, taille_grille=15, activer_3d=False):
+        self.taille_grille = int(taille_grille)
+        self.dims = 3 if activer_3d else 2
+        self.side = 2 * self.taille_grille + 1
+        padded = self.side + 2
+        self.shape = (padded,) * self.dims
+
+        # Une seule allocation : tout est occupé, puis l'intérieur est libéré à travers une vue
+        self.cells = bytearray(b"\x01") * padded ** self.dims
+        occupancy = np.frombuffer(self.cells, dtype=np.uint8).reshape(self.shape)
+        occupancy[(slice(1, -1),) * self.dims] = 0
+        del occupancy
+
+        # Décalages à plat vers les voisins (même ordre que les directions de generate_maze_path)
+        strides = [padded ** (self.dims - 1 - axis) for axis in range(self.dims)]
+        x_stride, z_stride = strides[0], strides[-1]
+        self.offsets = [x_stride, -x_stride, z_stride, -z_stride]
+        if activer_3d:
+            self.offsets.extend([strides[1], -strides[1]])
+
+    @property
+    def occupancy(self):
+        """Vue booléenne (sans copie) des cellules de la grille, bordure exclue."""
+        array = np.frombuffer(self.cells, dtype=np.bool_).reshape(self.shape)
+        return array[(slice(1, -1),) * self.dims]
+
+    def index(self, cell):
+        """Indice à plat d'une cellule (x, z) ou (x, y, z) en coordonnées centrées."""
+        return int(np.ravel_multi_index(tuple(c + self.taille_grille + 1 for c in cell), self.shape))
+
+    def to_points(self, indices, longueur_segment=1.0, dtype=np.float64):
+        """Convertit des indices à plat en points (N, 3) dans l'espace du monde."""
+        coords = np.unravel_index(np.asarray(indices, dtype=np.int64), self.shape)
+        points = np.zeros((len(coords[0]), 3), dtype=dtype)
+        axes = (0, 2) if self.dims == 2 else (0, 1, 2)
+        for axis, coord in zip(axes, coords):
+            points[:, axis] = (coord - (self.taille_grille + 1)) * longueur_segment
+        return points
+
+def _grid_cells(taille_grille, longueur_segment):
+    """Nombre de cellules de part et d'autre de l'origine dans une demi-taille taille_grille (unités du monde)."""
+    return max(0, math.floor(taille_grille / longueur_segment + 1e-9))
+
+def _random_start(grid, rng):
+    """Cellule de départ aléatoire près de l'origine, au niveau du sol (y=0)."""
+    limit = min(2, grid.taille_grille)
+    start_x = rng.randint(-limit, limit)
+    start_z = rng.randint(-limit, limit)
+    return (start_x, start_z) if grid.dims == 2 else (start_x, 0, start_z)
+
+def _rng(seed):
+    """
+    Générateur aléatoire d'une graine ; sans graine, le module random (reproductible par random.seed).
+    Les entiers numpy (graines issues de np.arange, SeedSequence, ...) sont convertis en int,
+    seul type entier accepté par random.Random.
+    """
+    if seed is None:
+        return random
+    if isinstance(seed, np.integer):
+        seed = operator.index(seed)
+    return random.Random(seed)
+
+def _next_cell(cells, offsets, current, rand, tried=()):
+    """
+    Choisit au hasard le prochain point parmi les voisins libres de current, en privilégiant
+    (heuristique de Warnsdorff) ceux qui n'ont plus qu'un ou deux voisins libres : le chemin
+    longe les murs et les portions déjà tracées au lieu d'isoler des poches inaccessibles.
+
+    :param tried: Voisins déjà essayés depuis current, exclus du choix.
+    :return: Indice à plat du voisin choisi, ou None en cas d'impasse.
+    """
+    candidates = [n for n in [current + o for o in offsets] if not cells[n] and n not in tried]
+    if not candidates:
+        return None
+    if len(candidates) > 1:
+        degrees = [len([0 for o in offsets if not cells[n + o]]) for n in candidates]
+        constrained = [n for n, d in zip(candidates, degrees) if 0 < d <= 2]
+        open_cells = [n for n, d in zip(candidates, degrees) if d > 0]
+        candidates = constrained or open_cells or candidates
+    return candidates[int(rand() * len(candidates))]
+
+def _walk(grid, start, nb_segments, rng):
+    """
+    Recherche en profondeur aléatoire d'un chemin à partir de start (voir _iter_walk, dont
+    c'est la variante sans morceaux).
+
+    :return: Liste des indices à plat du chemin : nb_segments + 1 points si un tel chemin est
+             trouvé dans le budget, sinon le plus long chemin rencontré.
+    """
+    target = nb_segments + 1
+    return next(_iter_walk(grid, start, nb_segments, rng, target, target), [])
+
+def _iter_walk(grid, start, nb_segments, rng, chunk_size, backtrack_window):
+    """
+    Recherche en profondeur aléatoire d'un chemin à partir de start (voir _next_cell), produit
+    par morceaux (listes d'indices à plat). En cas d'impasse, le chemin recule : la cellule
+    retirée redevient libre et le point précédent essaie ses autres voisins.
+
+    Seuls les backtrack_window derniers points peuvent encore être retirés par un recul : les
+    points plus anciens sont définitifs et sont produits par morceaux de chunk_size points.
+    Une recherche qui s'enlise (RESTART_STEPS étapes par point sans produire de morceau) est
+    relancée depuis le début de la fenêtre, et la recherche s'arrête après BACKTRACK_BUDGET
+    étapes par point demandé. Si une impasse oblige à reculer au-delà de la fenêtre, ou si le
+    budget est épuisé, le chemin s'arrête au plus long tracé trouvé.
+    """
+    cells = grid.cells
+    offsets = grid.offsets
+    rand = rng.random
+    cells[start] = 1
+    path = [start]        # points non encore produits
+    tried = [set()]       # voisins déjà essayés depuis chaque point de path
+    emitted = 0
+    target = nb_segments + 1
+    steps = BACKTRACK_BUDGET * target
+    attempt_steps = RESTART_STEPS * min(target, chunk_size + backtrack_window)
+    attempt = attempt_steps
+
+    # Plus long tracé rencontré, et longueur du préfixe qu'il partage avec path
+    best = []
+    common = 0
+    while emitted + len(path) < target and steps > 0:
+        steps -= 1
+        attempt -= 1
+        if attempt <= 0:
+            # Relance : libère les points de la fenêtre, sauf le premier
+            if len(path) > len(best):
+                best[common:] = path[common:]
+                common = len(path)
+            for cell in path[1:]:
+                cells[cell] = 0
+            del path[1:]
+            tried = [set()]
+            common = min(common, 1)
+            attempt = attempt_steps
+        nxt = _next_cell(cells, offsets, path[-1], rand, tried[-1])
+        if nxt is not None:
+            tried[-1].add(nxt)
+            cells[nxt] = 1
+            path.append(nxt)
+            tried.append(set())
+            if len(path) >= chunk_size + backtrack_window:
+                chunk = path[:chunk_size]
+                del path[:chunk_size]
+                del tried[:chunk_size]
+                emitted += chunk_size
+                attempt = attempt_steps = RESTART_STEPS * min(target - emitted, chunk_size + backtrack_window)
+                # Le plus long tracé mémorisé doit partager le morceau produit
+                if common >= chunk_size:
+                    del best[:chunk_size]
+                    common -= chunk_size
+                else:
+                    best, common = [], 0
+                yield chunk
+            continue
+        # Impasse : mémorise le tracé s'il est le plus long, puis recule en libérant la cellule
+        if len(path) > len(best):
+            best[common:] = path[common:]
+            common = len(path)
+        cells[path.pop()] = 0
+        tried.pop()
+        common = min(common, len(path))
+        if not path:
+            break
+    if len(path) < len(best):
+        path = best
+    if path:
+        yield path
+
+def generate_maze_path_array(nb_segments, taille_grille=15, longueur_segment=1.0, activer_3d=False, seed=None):
+    """
+    Génère un chemin ressemblant à un labyrinthe dans une grille centrée autour de l'origine,
+    sous forme de tableau (N, 3). Le chemin évite les auto-intersections : seuls les voisins
+    libres sont choisis et le chemin recule en cas d'impasse pour essayer d'autres voisins.
+    La recherche est bornée (BACKTRACK_BUDGET étapes par point) : si aucun chemin de
+    nb_segments segments n'est trouvé dans ce budget, le plus long chemin rencontré est
+    retourné (au mieux).
+
+    :param nb_segments: Nombre de segments dans le chemin.
+    :param taille_grille: Demi-taille de la grille en unités du monde : le chemin reste dans
+                          [-taille_grille, taille_grille] sur chaque axe, quelle que soit longueur_segment.
+    :param longueur_segment: Longueur de chaque segment.
+    :param activer_3d: Si True, permet un mouvement sur l'axe y pour un chemin en 3D.
+    :param seed: Graine du générateur aléatoire (None : module random, reproductible par random.seed).
+    :return: Tableau (N, 3) des points du chemin.
+    """
+    rng = _rng(seed)
+    grid = MazeGrid(_grid_cells(taille_grille, longueur_segment), activer_3d)
+    start = grid.index(_random_start(grid, rng))
+    return grid.to_points(_walk(grid, start, nb_segments, rng), longueur_segment)
+
+def generate_maze_path(nb_segments, taille_grille=15, longueur_segment=1.0, activer_3d=False, seed=None):
+    """
+    Génère un chemin ressemblant à un labyrinthe dans une grille centrée autour de l'origine.
+    Le chemin évite les auto-intersections et peut être généré en 2D ou en 3D.
+
+    :param nb_segments: Nombre de segments dans le chemin.
+    :param taille_grille: Demi-taille de la grille en unités du monde (voir generate_maze_path_array).
+    :param longueur_segment: Longueur de chaque segment.
+    :param activer_3d: Si True, permet un mouvement sur l'axe y pour un chemin en 3D.
+    :param seed: Graine du générateur aléatoire (None : module random, reproductible par random.seed).
+    :return: Liste de points Vector3 représentant le chemin du labyrinthe.
+    """
+    return to_vector3_list(generate_maze_path_array(nb_segments, taille_grille, longueur_segment, activer_3d, seed))
+
+def _generate_job(job):
+    seed, nb_segments, taille_grille, longueur_segment, activer_3d, dtype = job
+    path = generate_maze_path_array(nb_segments, taille_grille, longueur_segment, activer_3d, seed)
+    return path.astype(dtype, copy=False)
+
+def _per_path(value, count):
+    """Répète un paramètre commun, ou vérifie qu'une liste de paramètres a une valeur par chemin."""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        if len(value) != count:
+            raise ValueError("un paramètre par chemin est attendu")
+        return list(value)
+    return [value] * count
+
+def generate_maze_paths(seeds, nb_segments, taille_grille=15, longueur_segment=1.0, activer_3d=False,
+                        processes=None, dtype=np.float32):
+    """
+    Génère un chemin par graine, éventuellement réparti sur un pool de processus.
+    Chaque chemin ne dépend que de sa graine et de ses paramètres : le résultat est
+    identique quel que soit le nombre de processus.
+
+    :param seeds: Liste des graines (une par chemin).
+    :param nb_segments: Nombre de segments, commun ou un par chemin (de même pour les paramètres suivants).
+    :param taille_grille: Demi-taille de la grille, en unités du monde.
+    :param longueur_segment: Longueur de chaque segment.
+    :param activer_3d: Si True, chemins en 3D.
+    :param processes: Nombre de processus (None ou 0 : génération dans ce processus).
+    :param dtype: Type flottant des points retournés.
+    :return: Tuple (points (P, 3) de tous les chemins bout à bout, offsets (n + 1,)) :
+             le chemin i correspond à points[offsets[i]:offsets[i + 1]].
+    """
+    seeds = list(seeds)
+    count = len(seeds)
+    jobs = list(zip(seeds, _per_path(nb_segments, count), _per_path(taille_grille, count),
+                    _per_path(longueur_segment, count), _per_path(activer_3d, count), [dtype] * count))
+
+    if processes:
+        with ProcessPoolExecutor(processes) as executor:
+            paths = list(executor.map(_generate_job, jobs, chunksize=max(1, count // (4 * processes))))
+    else:
+        paths = [_generate_job(job) for job in jobs]
+
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum([len(path) for path in paths], out=offsets[1:])
+    points = np.concatenate(paths) if paths else np.empty((0, 3), dtype=dtype)
+    return points, offsets
+
+def iter_maze_path(nb_segments, taille_grille=15, longueur_segment=1.0, activer_3d=False, seed=None,
+                   chunk_size=65536, backtrack_window=4096, dtype=np.float32):
+    """
+    Génère un chemin de labyrinthe (comme generate_maze_path_array) au fil de l'eau, sans
+    le matérialiser entièrement : les points sont produits par morceaux dès qu'ils sont
+    définitifs, ce qui permet de les consommer au fur et à mesure (PathAnalysis.extend,
+    PathBuffer.extend, export, ...). Le recul en cas d'impasse est limité aux
+    backtrack_window derniers points.
+
+    :param chunk_size: Nombre de points par morceau (sauf le dernier).
+    :param backtrack_window: Nombre de points récents sur lesquels le chemin peut reculer.
+    :param dtype: Type flottant des points produits.
+    :return: Générateur de tableaux (K, 3) ; mis bout à bout, ils forment le chemin.
+    """
+    rng = _rng(seed)
+    grid = MazeGrid(_grid_cells(taille_grille, longueur_segment), activer_3d)
+    start = grid.index(_random_start(grid, rng))
+    for chunk in _iter_walk(grid, start, nb_segments, rng, max(1, chunk_size), max(1, backtrack_window)):
+        yield grid.to_points(chunk, longueur_segment, dtype)
@@ -0,0 +1,152 @@
+import numpy as np
+
+def _index_dtype(count):
+    """Plus petit type entier suffisant pour indexer count éléments (int32 si possible, pour la mémoire)."""
+    return np.int32 if count < np.iinfo(np.int32).max else np.int64
+
+def _csr(keys, key_count, dtype):
+    """
+    Regroupe les positions 0..len(keys)-1 par clé.
+
+    :return: (offsets (key_count + 1,), positions triées par clé (len(keys),)) : les positions
+             de la clé k sont positions[offsets[k]:offsets[k + 1]].
+    """
+    order = np.argsort(keys, kind="stable").astype(dtype)
+    offsets = np.zeros(key_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=key_count), out=offsets[1:])
+    return offsets, order
+
+class MeshAdjacency:
+    """
+    Structure d'adjacence compacte d'un mesh triangulaire, construite une seule fois à partir du tableau
+    des faces et stockée dans des tableaux numpy (format CSR : offsets + indices) :
+
+    - edges : arêtes uniques (E, 2), avec edges[:, 0] < edges[:, 1] ;
+    - face_edges : indice de l'arête de chaque côté de chaque face (F, 3), le côté k allant
+      de faces[:, k] à faces[:, (k + 1) % 3] ;
+    - edge_face_offsets / edge_face_indices : faces incidentes à chaque arête ;
+    - vertex_face_offsets / vertex_face_indices : faces incidentes à chaque sommet ;
+    - vertex_neighbor_offsets / vertex_neighbor_indices : sommets voisins de chaque sommet ;
+    - face_neighbors : face voisine par chaque côté (F, 3), -1 sur un bord. Sur une arête partagée
+      par plus de deux faces (non manifold), les faces de l'arête sont chaînées en cycle.
+
+    Les requêtes par sommet ou par face coûtent O(degré). Les indices sont en int32 tant que possible.
+
+    :param faces: Faces triangulaires (F, 3).
+    :param vertex_count: Nombre de sommets (par défaut, le plus grand indice utilisé + 1).
+    """
+
+    def __init__(self, faces, vertex_count=None):
+        faces = np.asarray(faces)
+        if vertex_count is None:
+            vertex_count = int(faces.max()) + 1 if faces.size else 0
+        self.vertex_count = vertex_count
+        self.face_count = len(faces)
+        vertex_dtype = _index_dtype(vertex_count)
+        face_dtype = _index_dtype(3 * self.face_count)
+        self.faces = faces.astype(vertex_dtype, copy=False)
+
+        # Demi-arêtes : la demi-arête h = 3 * f + k est le côté k de la face f
+        starts = self.faces.ravel().astype(np.int64)
+        ends = self.faces[:, [1, 2, 0]].ravel().astype(np.int64)
+        keys = np.minimum(starts, ends) * vertex_count + np.maximum(starts, ends)
+        del starts, ends
+        # Un seul tri des demi-arêtes donne à la fois les arêtes uniques et leur regroupement par arête
+        halfedges = np.argsort(keys, kind="stable").astype(face_dtype)
+        sorted_keys = keys[halfedges]
+        del keys
+        is_first = np.empty(len(sorted_keys), dtype=bool)
+        is_first[:1] = True
+        np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=is_first[1:])
+        unique_keys = sorted_keys[is_first]
+        del sorted_keys
+        halfedge_edges = np.empty(len(halfedges), dtype=face_dtype)
+        halfedge_edges[halfedges] = np.cumsum(is_first, dtype=face_dtype) - 1
+        self.edges = np.stack([unique_keys // vertex_count, unique_keys % vertex_count], axis=1).astype(vertex_dtype)
+        self.face_edges = halfedge_edges.reshape(-1, 3)
+
+        self.edge_face_offsets = np.append(np.flatnonzero(is_first), len(halfedges)).astype(np.int64)
+        self.edge_face_indices = halfedges // 3
+
+        # Face voisine : la demi-arête suivante (en cycle) parmi celles de la même arête
+        counts = np.diff(self.edge_face_offsets)
+        group_starts = np.repeat(self.edge_face_offsets[:-1], counts)
+        following = np.arange(1, len(halfedges) + 1)
+        wrap = following == np.repeat(self.edge_face_offsets[1:], counts)
+        following[wrap] = group_starts[wrap]
+        neighbors = np.empty(len(halfedges), dtype=face_dtype)
+        neighbors[halfedges] = halfedges[following] // 3
+        neighbors[halfedges[np.repeat(counts == 1, counts)]] = -1
+        self.face_neighbors = neighbors.reshape(-1, 3)
+
+        self.vertex_face_offsets, corners = _csr(self.faces.ravel(), vertex_count, face_dtype)
+        self.vertex_face_indices = corners // 3
+
+        sources = np.concatenate([self.edges[:, 0], self.edges[:, 1]])
+        targets = np.concatenate([self.edges[:, 1], self.edges[:, 0]])
+        self.vertex_neighbor_offsets, order = _csr(sources, vertex_count, _index_dtype(len(sources)))
+        self.vertex_neighbor_indices = targets[order]
+
+    @property
+    def edge_count(self):
+        return len(self.edges)
+
+    @property
+    def edge_face_counts(self):
+        """Nombre de faces incidentes à chaque arête (E,) : 1 sur un bord, 2 à l'intérieur d'une surface fermée."""
+        return np.diff(self.edge_face_offsets)
+
+    @property
+    def vertex_degrees(self):
+        """Nombre de sommets voisins de chaque sommet (V,)."""
+        return np.diff(self.vertex_neighbor_offsets)
+
+    def vertex_faces(self, vertex):
+        """Faces incidentes au sommet vertex."""
+        return self.vertex_face_indices[self.vertex_face_offsets[vertex]:self.vertex_face_offsets[vertex + 1]]
+
+    def vertex_neighbors(self, vertex):
+        """Sommets reliés au sommet vertex par une arête."""
+        return self.vertex_neighbor_indices[self.vertex_neighbor_offsets[vertex]:self.vertex_neighbor_offsets[vertex + 1]]
+
+    def edge_faces(self, edge):
+        """Faces incidentes à l'arête edge."""
+        return self.edge_face_indices[self.edge_face_offsets[edge]:self.edge_face_offsets[edge + 1]]
+
+    def boundary_edges(self):
+        """Indices des arêtes de bord (une seule face incidente)."""
+        return np.flatnonzero(self.edge_face_counts == 1)
+
+    def boundary_vertices(self):
+        """Indices des sommets situés sur un bord."""
+        return np.unique(self.edges[self.boundary_edges()])
+
+    def non_manifold_edges(self):
+        """Indices des arêtes partagées par plus de deux faces."""
+        return np.flatnonzero(self.edge_face_counts > 2)
+
+    def vertex_normal(self, vertex, face_normals):
+        """Normale du sommet vertex : moyenne normalisée des normales de ses faces, en O(degré)."""
+        normal = np.asarray(face_normals)[self.vertex_faces(vertex)].sum(axis=0)
+        length = np.linalg.norm(normal)
+        return normal / length if length > 0 else normal
+
+    def smooth(self, vertices, iterations=1, factor=0.5):
+        """
+        Lissage laplacien : chaque sommet se rapproche de la moyenne de ses voisins.
+
+        :param vertices: Sommets (V, 3).
+        :param iterations: Nombre de passes.
+        :param factor: Fraction du déplacement vers la moyenne des voisins (0 : aucun, 1 : jusqu'à la moyenne).
+        :return: Nouveau tableau de sommets (V, 3) ; les sommets isolés ne bougent pas.
+        """
+        vertices = np.asarray(vertices, dtype=np.float64).copy()
+        degrees = self.vertex_degrees
+        connected = degrees > 0
+        # Les voisins sont rangés par sommet : une somme par segment CSR (non vide) suffit
+        segment_starts = self.vertex_neighbor_offsets[:-1][connected]
+        for _ in range(iterations):
+            sums = np.add.reduceat(vertices[self.vertex_neighbor_indices], segment_starts, axis=0)
+            means = sums / degrees[connected, np.newaxis]
+            vertices[connected] += factor * (means - vertices[connected])
+        return vertices
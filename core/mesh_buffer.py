@@ -0,0 +1,150 @@
+import numpy as np
+
+from core.draw_backend import get_backend
+
+# Octaèdre unitaire (8 triangles) utilisé pour représenter les sommets
+_OCTAHEDRON = np.array([
+    (1, 0, 0), (0, 1, 0), (0, 0, 1),   (0, 1, 0), (-1, 0, 0), (0, 0, 1),
+    (-1, 0, 0), (0, -1, 0), (0, 0, 1), (0, -1, 0), (1, 0, 0), (0, 0, 1),
+    (0, 1, 0), (1, 0, 0), (0, 0, -1),  (-1, 0, 0), (0, 1, 0), (0, 0, -1),
+    (0, -1, 0), (-1, 0, 0), (0, 0, -1), (1, 0, 0), (0, -1, 0), (0, 0, -1),
+], dtype=np.float32)
+
+class MeshChunk:
+    """
+    Tampon de triangles prêt à être envoyé au GPU : trois sommets (float32) par face,
+    pour les faces [face_start, face_stop) du mesh (dans l'ordre face_order éventuel).
+    """
+
+    def __init__(self, positions, normals, face_start, face_stop):
+        self.positions = positions
+        self.normals = normals
+        self.face_start = face_start
+        self.face_stop = face_stop
+
+    @property
+    def triangle_count(self):
+        return len(self.positions) // 3
+
+def build_mesh_chunks(vertices, faces, vertex_normals=None, face_normals=None, faces_per_chunk=1 << 20,
+                      face_order=None):
+    """
+    Construit les tampons de sommets (sans index) d'un mesh, par blocs de faces_per_chunk faces.
+    Ne dépend pas de pyray : peut être utilisé et testé sans fenêtre.
+
+    :param vertices: Sommets (V, 3).
+    :param faces: Faces triangulaires (F, 3).
+    :param vertex_normals: Normales des sommets (V, 3) pour un rendu lissé (optionnel).
+    :param face_normals: Normales des faces (F, 3) pour un rendu à facettes, si vertex_normals n'est pas fourni.
+    :param faces_per_chunk: Nombre maximal de faces par tampon.
+    :param face_order: Permutation des faces (optionnel), appliquée avant le découpage en blocs.
+    :return: Liste de MeshChunk.
+    """
+    vertices = np.asarray(vertices)
+    faces = np.asarray(faces)
+    if face_order is not None:
+        faces = faces[face_order]
+        if face_normals is not None:
+            face_normals = np.asarray(face_normals)[face_order]
+    chunks = []
+    for start in range(0, len(faces), faces_per_chunk):
+        stop = min(start + faces_per_chunk, len(faces))
+        chunk_faces = faces[start:stop]
+        positions = vertices[chunk_faces].astype(np.float32).reshape(-1, 3)
+        if vertex_normals is not None:
+            normals = np.asarray(vertex_normals)[chunk_faces].astype(np.float32).reshape(-1, 3)
+        elif face_normals is not None:
+            normals = np.repeat(np.asarray(face_normals[start:stop], dtype=np.float32), 3, axis=0)
+        else:
+            normals = None
+        chunks.append(MeshChunk(positions, normals, start, stop))
+    return chunks
+
+def build_point_glyphs(points, radius=0.05):
+    """Construit un tampon de triangles (8 par point) représentant chaque point par un petit octaèdre."""
+    points = np.asarray(points, dtype=np.float32)
+    glyphs = points[:, np.newaxis, :] + _OCTAHEDRON[np.newaxis] * np.float32(radius)
+    return glyphs.reshape(-1, 3)
+
+def upload_triangles(positions, normals=None):
+    """
+    Envoie un tampon de triangles (K * 3, 3) au GPU et retourne le Model raylib correspondant.
+    Les données sont copiées dans de la mémoire allouée par raylib, libérée par pr.unload_model.
+    Nécessite une fenêtre (contexte OpenGL) ouverte.
+    """
+    pr = get_backend()
+
+    mesh = pr.Mesh()
+    mesh.vertexCount = len(positions)
+    mesh.triangleCount = len(positions) // 3
+    mesh.vertices = _raylib_copy(pr, positions)
+    if normals is not None:
+        mesh.normals = _raylib_copy(pr, normals)
+    pr.upload_mesh(mesh, False)
+    return pr.load_model_from_mesh(mesh)
+
+def _raylib_copy(pr, array):
+    array = np.ascontiguousarray(array, dtype=np.float32)
+    pointer = pr.ffi.cast("float *", pr.mem_alloc(array.nbytes))
+    pr.ffi.memmove(pointer, array, array.nbytes)
+    return pointer
+
+class GpuMesh:
+    """
+    Mesh envoyé une seule fois au GPU puis dessiné par un appel pr.draw_model par bloc
+    (un seul bloc jusqu'à faces_per_chunk faces), au lieu d'un appel par triangle.
+    Les arêtes (mode fil de fer du même modèle) et les sommets (octaèdres regroupés dans
+    un seul tampon) peuvent être superposés.
+    Les sommets peuvent aussi être découpés en blocs (vertices_per_chunk, dans l'ordre vertex_order),
+    pour ne dessiner que ceux retenus par core.culling.
+
+    Les tampons sont construits à la création (sans fenêtre) et envoyés au GPU au premier dessin.
+    """
+
+    def __init__(self, vertices, faces, vertex_normals=None, face_normals=None, faces_per_chunk=1 << 20,
+                 point_radius=0.05, face_order=None, vertex_order=None, vertices_per_chunk=None):
+        self.chunks = build_mesh_chunks(vertices, faces, vertex_normals, face_normals, faces_per_chunk, face_order)
+        points = np.asarray(vertices)
+        if vertex_order is not None:
+            points = points[vertex_order]
+        step = vertices_per_chunk or max(len(points), 1)
+        self.point_chunks = [build_point_glyphs(points[start:start + step], point_radius)
+                             for start in range(0, len(points), step)]
+        self.models = None
+        self.point_models = None
+
+    def upload(self):
+        """Envoie les tampons au GPU (fait automatiquement au premier dessin)."""
+        self.models = [upload_triangles(chunk.positions, chunk.normals) for chunk in self.chunks]
+        self.point_models = [upload_triangles(positions) for positions in self.point_chunks]
+
+    def draw(self, color=None, wire_color=None, point_color=None, chunks=None, point_chunks=None):
+        """
+        Dessine les faces (color), et en option les arêtes (wire_color) et les sommets (point_color).
+        :param chunks: Indices des blocs de faces à dessiner (tous par défaut).
+        :param point_chunks: Indices des blocs de sommets à dessiner (tous par défaut).
+        """
+        pr = get_backend()
+
+        if self.models is None:
+            self.upload()
+        origin = pr.Vector3(0, 0, 0)
+        models = self.models if chunks is None else [self.models[i] for i in chunks]
+        for model in models:
+            if color is not None:
+                pr.draw_model(model, origin, 1.0, color)
+            if wire_color is not None:
+                pr.draw_model_wires(model, origin, 1.0, wire_color)
+        if point_color is not None:
+            point_models = self.point_models if point_chunks is None else [self.point_models[i] for i in point_chunks]
+            for model in point_models:
+                pr.draw_model(model, origin, 1.0, point_color)
+
+    def unload(self):
+        """Libère les modèles du GPU."""
+        pr = get_backend()
+
+        for model in (self.models or []) + (self.point_models or []):
+            pr.unload_model(model)
+        self.models = None
+        self.point_models = None
@@ -0,0 +1,262 @@
+import math
+import os
+import shutil
+
+import numpy as np
+
+from core.mesh_normals import compute_face_normals_array, compute_vertex_normals_array, iter_face_chunks
+from core.normals_cache import (DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, cache_key, load_entry, mesh_content_hash,
+                                prune_cache, store_entry)
+
+# Version du format des niveaux de détail en cache : à incrémenter si la simplification change
+LOD_VERSION = 1
+
+LEVEL_FILES = ("vertices.npy", "faces.npy", "face_centers.npy", "face_normals.npy", "vertex_normals.npy")
+
+# Composantes (ligne, colonne) stockées de la quadrique symétrique 4 x 4
+_QUADRIC_TERMS = ((0, 0), (0, 1), (0, 2), (0, 3), (1, 1), (1, 2), (1, 3), (2, 2), (2, 3), (3, 3))
+
+def _cluster_quadrics(vertices, faces, clusters, cluster_count, chunk_size=1 << 20):
+    """
+    Accumule, pour chaque groupe de sommets, la quadrique d'erreur (Garland et Heckbert) des plans
+    des faces incidentes, pondérés par leur aire.
+
+    :return: Quadriques (C, 4, 4).
+    """
+    sums = np.zeros((len(_QUADRIC_TERMS), cluster_count))
+    for start, stop in iter_face_chunks(len(faces), chunk_size):
+        corners = vertices[faces[start:stop]]
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        # |n| vaut deux fois l'aire : plan unitaire pondéré par l'aire
+        double_areas = np.linalg.norm(normals, axis=1)
+        planes = np.empty((len(normals), 4))
+        np.divide(normals, double_areas[:, np.newaxis], out=planes[:, :3], where=double_areas[:, np.newaxis] > 0)
+        planes[double_areas == 0, :3] = 0
+        planes[:, 3] = -np.einsum("ij,ij->i", planes[:, :3], corners[:, 0])
+        weights = double_areas / 2
+        face_clusters = clusters[faces[start:stop]]
+        for term, (row, column) in enumerate(_QUADRIC_TERMS):
+            values = weights * planes[:, row] * planes[:, column]
+            for corner in range(3):
+                sums[term] += np.bincount(face_clusters[:, corner], weights=values, minlength=cluster_count)
+    quadrics = np.empty((cluster_count, 4, 4))
+    for term, (row, column) in enumerate(_QUADRIC_TERMS):
+        quadrics[:, row, column] = quadrics[:, column, row] = sums[term]
+    return quadrics
+
+def cluster_decimate(vertices, faces, cell_size, chunk_size=1 << 20):
+    """
+    Simplifie un mesh par regroupement de sommets : les sommets d'une même cellule d'une grille
+    de pas cell_size sont fusionnés en un seul, placé au point qui minimise l'erreur quadrique
+    des faces incidentes (restreint à la cellule) ; les faces devenues dégénérées ou en double
+    sont supprimées. Le coût est linéaire en nombre de faces.
+
+    :param vertices: Sommets (V, 3).
+    :param faces: Faces triangulaires (F, 3).
+    :param cell_size: Pas de la grille.
+    :return: Tuple (sommets (V', 3), faces (F', 3), erreur) : l'erreur est la plus grande distance
+             quadratique moyenne (pondérée par l'aire) d'un sommet fusionné aux plans de ses faces d'origine.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.asarray(faces)
+    origin = vertices.min(axis=0)
+    cells = np.floor((vertices - origin) / cell_size).astype(np.int64)
+    if cells.max(initial=0) < 1 << 21:
+        # Les trois coordonnées tiennent sur 21 bits chacune : un seul entier par cellule
+        keys = (cells[:, 0] << 42) | (cells[:, 1] << 21) | cells[:, 2]
+        unique_keys, clusters = np.unique(keys, return_inverse=True)
+        cluster_cells = np.stack([unique_keys >> 42, (unique_keys >> 21) & 0x1FFFFF, unique_keys & 0x1FFFFF], axis=1)
+    else:
+        # Grille trop fine pour ce codage : regroupement (plus lent) sur les lignes de cells
+        cluster_cells, clusters = np.unique(cells, axis=0, return_inverse=True)
+    clusters = clusters.reshape(-1)
+    cluster_count = len(cluster_cells)
+
+    # Position optimale : minimise x^T A x - 2 b^T x, attirée faiblement vers la moyenne
+    # des sommets du groupe pour rester bien définie sur les zones planes
+    counts = np.bincount(clusters, minlength=cluster_count)
+    means = np.stack([np.bincount(clusters, weights=vertices[:, axis], minlength=cluster_count)
+                      for axis in range(3)], axis=1) / counts[:, np.newaxis]
+    quadrics = _cluster_quadrics(vertices, faces, clusters, cluster_count, chunk_size)
+    a, b = quadrics[:, :3, :3], -quadrics[:, :3, 3]
+    regularization = 1e-3 * np.trace(a, axis1=1, axis2=2) / 3 + 1e-12
+    a = a + regularization[:, np.newaxis, np.newaxis] * np.eye(3)
+    positions = np.linalg.solve(a, (b + regularization[:, np.newaxis] * means)[..., np.newaxis])[..., 0]
+    low = origin + cluster_cells * cell_size
+    positions = np.clip(positions, low, low + cell_size)
+    homogeneous = np.concatenate([positions, np.ones((cluster_count, 1))], axis=1)
+    residuals = np.einsum("ci,cij,cj->c", homogeneous, quadrics, homogeneous)
+    total_areas = np.trace(quadrics[:, :3, :3], axis1=1, axis2=2)
+    error = float(np.sqrt(np.max(np.divide(np.maximum(residuals, 0), total_areas,
+                                           out=np.zeros(cluster_count), where=total_areas > 0), initial=0.0)))
+
+    new_faces = clusters[faces]
+    keep = ((new_faces[:, 0] != new_faces[:, 1]) & (new_faces[:, 1] != new_faces[:, 2])
+            & (new_faces[:, 2] != new_faces[:, 0]))
+    new_faces = new_faces[keep]
+    # Faces en double (mêmes trois sommets) : seule la première est gardée
+    _, first = np.unique(np.sort(new_faces, axis=1), axis=0, return_index=True)
+    new_faces = new_faces[np.sort(first)]
+
+    # Seuls les sommets encore utilisés sont gardés
+    used, new_faces = np.unique(new_faces, return_inverse=True)
+    index_dtype = np.int32 if len(used) < np.iinfo(np.int32).max else np.int64
+    return positions[used], new_faces.reshape(-1, 3).astype(index_dtype), error
+
+class LodLevel:
+    """Un niveau de détail : mesh simplifié, ses normales et l'erreur géométrique (en unités du mesh) qu'il introduit."""
+
+    def __init__(self, vertices, faces, face_centers, face_normals, vertex_normals, error):
+        self.vertices = vertices
+        self.faces = faces
+        self.face_centers = face_centers
+        self.face_normals = face_normals
+        self.vertex_normals = vertex_normals
+        self.error = error
+
+    @classmethod
+    def from_mesh(cls, vertices, faces, error, mode="uniform"):
+        """Construit un niveau en calculant les normales de ses faces et de ses sommets."""
+        centers, face_normals = compute_face_normals_array(vertices, faces)
+        vertex_normals = compute_vertex_normals_array(vertices, faces, mode, face_normals=face_normals)
+        return cls(vertices, faces, centers, face_normals, vertex_normals, error)
+
+    @property
+    def face_count(self):
+        return len(self.faces)
+
+    def arrays(self):
+        return self.vertices, self.faces, self.face_centers, self.face_normals, self.vertex_normals
+
+class LodPyramid:
+    """
+    Pyramide de niveaux de détail d'un mesh, du plus fin (niveau 0, le mesh d'origine) au plus grossier.
+    select choisit à chaque image le niveau le plus grossier dont l'erreur, projetée à l'écran,
+    reste sous un seuil en pixels.
+    """
+
+    def __init__(self, levels):
+        self.levels = levels
+        vertices = np.asarray(levels[0].vertices, dtype=np.float64).reshape(-1, 3)
+        if not len(vertices):
+            vertices = np.zeros((1, 3))
+        low, high = vertices.min(axis=0), vertices.max(axis=0)
+        self.center = (low + high) / 2
+        self.radius = float(np.linalg.norm(high - low)) / 2
+
+    def __len__(self):
+        return len(self.levels)
+
+    def __getitem__(self, index):
+        return self.levels[index]
+
+    def select(self, camera_position, fovy=45.0, screen_height=600, pixel_error=1.0):
+        """
+        Indice du niveau à dessiner pour une position de caméra.
+
+        :param camera_position: Position de la caméra (Vector3 ou triplet).
+        :param fovy: Champ de vision vertical en degrés.
+        :param screen_height: Hauteur de l'écran en pixels.
+        :param pixel_error: Erreur maximale tolérée, en pixels à l'écran.
+        """
+        if hasattr(camera_position, "x"):
+            camera_position = (camera_position.x, camera_position.y, camera_position.z)
+        distance = float(np.linalg.norm(np.asarray(camera_position, dtype=np.float64) - self.center)) - self.radius
+        distance = max(distance, 1e-6)
+        pixels_per_unit = screen_height / (2 * distance * math.tan(math.radians(fovy) / 2))
+        level = 0
+        for index, lod in enumerate(self.levels):
+            if lod.error * pixels_per_unit <= pixel_error:
+                level = index
+        return level
+
+def _mean_edge_length(vertices, faces, sample=1 << 16):
+    faces = np.asarray(faces)
+    step = max(1, len(faces) // sample)
+    corners = np.asarray(vertices)[faces[::step]]
+    return float(np.linalg.norm(corners[:, 1] - corners[:, 0], axis=1).mean())
+
+def build_lod_pyramid(vertices, faces, max_levels=6, reduction=4, min_faces=1000, mode="uniform",
+                      normals=None):
+    """
+    Construit une pyramide de niveaux de détail, chaque niveau ayant environ reduction fois moins
+    de faces que le précédent (le pas de la grille de regroupement est multiplié par sqrt(reduction)).
+    La construction s'arrête à max_levels niveaux, sous min_faces faces, ou quand un niveau ne réduit plus le mesh.
+
+    :param vertices: Sommets (V, 3).
+    :param faces: Faces triangulaires (F, 3).
+    :param mode: Pondération des normales des sommets ("uniform", "area" ou "angle").
+    :param normals: Normales déjà calculées du mesh d'origine (centres, normales des faces, normales des sommets),
+                    par exemple lues par load_or_compute_normals (optionnel).
+    :return: LodPyramid.
+    """
+    vertices = np.asarray(vertices)
+    faces = np.asarray(faces)
+    if normals is None:
+        levels = [LodLevel.from_mesh(vertices, faces, 0.0, mode)]
+    else:
+        levels = [LodLevel(vertices, faces, *normals, 0.0)]
+    if not len(faces):
+        return LodPyramid(levels)
+
+    scale = math.sqrt(reduction)
+    cell_size = _mean_edge_length(vertices, faces) * scale
+    while len(levels) < max_levels and levels[-1].face_count > min_faces:
+        previous = levels[-1]
+        level_vertices, level_faces, error = cluster_decimate(previous.vertices, previous.faces, cell_size)
+        if not len(level_faces) or len(level_faces) > 0.75 * previous.face_count:
+            if len(level_faces):
+                cell_size *= scale
+                continue
+            break
+        # Les erreurs s'ajoutent d'un niveau à l'autre (chaque niveau simplifie le précédent)
+        levels.append(LodLevel.from_mesh(level_vertices, level_faces, previous.error + error, mode))
+        cell_size *= scale
+    return LodPyramid(levels)
+
+def _level_names(index):
+    return tuple(f"level{index}_{name}" for name in LEVEL_FILES)
+
+def load_or_build_lod_pyramid(vertices, faces, max_levels=6, reduction=4, min_faces=1000, mode="uniform",
+                              normals=None, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES,
+                              content_key=None):
+    """
+    Retourne la pyramide de niveaux de détail d'un mesh, relue depuis le cache disque (même
+    répertoire et même empreinte de contenu que load_or_compute_normals) si elle a déjà été construite
+    avec les mêmes paramètres, sinon construite puis enregistrée. Le niveau 0 n'est pas stocké :
+    c'est le mesh d'origine (avec normals s'il est fourni).
+
+    :param cache_dir: Répertoire du cache (None : pas de cache).
+    :param content_key: Empreinte mesh_content_hash(vertices, faces) déjà calculée, par exemple celle
+                        passée à load_or_compute_normals (sinon calculée ici).
+    :return: LodPyramid.
+    """
+    key = None
+    if cache_dir is not None:
+        if content_key is None:
+            content_key = mesh_content_hash(vertices, faces)
+        key = cache_key(content_key, "lod", max_levels, reduction, min_faces, mode, LOD_VERSION)
+        path = os.path.join(cache_dir, key)
+        if os.path.isdir(path):
+            entry = load_entry(path, ("errors.npy",))
+            if entry is not None:
+                errors = np.asarray(entry[0])
+                levels = [load_entry(path, _level_names(index)) for index in range(1, len(errors))]
+                if all(arrays is not None for arrays in levels):
+                    base = build_lod_pyramid(vertices, faces, max_levels=1, mode=mode, normals=normals)
+                    return LodPyramid(base.levels + [LodLevel(*arrays, float(error))
+                                                     for arrays, error in zip(levels, errors[1:])])
+            shutil.rmtree(path, ignore_errors=True)
+
+    pyramid = build_lod_pyramid(vertices, faces, max_levels, reduction, min_faces, mode, normals)
+
+    if key is not None:
+        arrays = [np.array([lod.error for lod in pyramid.levels])]
+        names = ["errors.npy"]
+        for index, lod in enumerate(pyramid.levels[1:], start=1):
+            arrays.extend(lod.arrays())
+            names.extend(_level_names(index))
+        os.makedirs(cache_dir, exist_ok=True)
+        store_entry(os.path.join(cache_dir, key), arrays, names)
+        prune_cache(cache_dir, max_bytes, keep=(key,))
+    return pyramid
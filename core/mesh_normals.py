@@ -0,0 +1,104 @@
+import numpy as np
+
+from core.vector_math import cross_product_batch, vector_normalize_batch
+
+def iter_face_chunks(face_count, chunk_size):
+    """Bornes (début, fin) des blocs successifs de chunk_size faces."""
+    for start in range(0, face_count, chunk_size):
+        yield start, min(start + chunk_size, face_count)
+
+def compute_face_normals_array(vertices, faces, dtype=np.float64, chunk_size=1 << 20):
+    """
+    Calcule le centre et la normale unitaire de chaque face triangulaire, par blocs de
+    chunk_size faces pour limiter la mémoire temporaire (les sommets de chaque bloc sont
+    obtenus par vertices[faces]).
+    Une face dégénérée (aire nulle) reçoit une normale nulle, comme avec vector_normalize.
+
+    :param vertices: Sommets (V, 3).
+    :param faces: Indices des sommets de chaque face (F, 3).
+    :param dtype: Type flottant des tableaux retournés.
+    :param chunk_size: Nombre de faces traitées par bloc.
+    :return: Tuple (centres (F, 3), normales unitaires (F, 3)).
+    """
+    vertices = np.asarray(vertices)
+    faces = np.asarray(faces)
+    centers = np.empty((len(faces), 3), dtype=dtype)
+    normals = np.empty((len(faces), 3), dtype=dtype)
+    for start, stop in iter_face_chunks(len(faces), chunk_size):
+        corners = vertices[faces[start:stop]].astype(dtype, copy=False)
+        v0, v1, v2 = corners[:, 0], corners[:, 1], corners[:, 2]
+        cross_product_batch(v1 - v0, v2 - v0, out=normals[start:stop])
+        vector_normalize_batch(normals[start:stop], out=normals[start:stop])
+        np.add(v0, v1, out=centers[start:stop])
+        centers[start:stop] += v2
+        centers[start:stop] /= 3
+    return centers, normals
+
+VERTEX_NORMAL_MODES = ("uniform", "area", "angle")
+
+def _corner_angles(v0, v1, v2):
+    """Angles (K, 3) des trois coins de chaque triangle."""
+    angles = np.empty((len(v0), 3), dtype=v0.dtype)
+    for corner, (a, b, c) in enumerate(((v0, v1, v2), (v1, v2, v0), (v2, v0, v1))):
+        ab = b - a
+        ac = c - a
+        sin_part = np.linalg.norm(cross_product_batch(ab, ac), axis=1)
+        cos_part = np.einsum("ij,ij->i", ab, ac)
+        angles[:, corner] = np.arctan2(sin_part, cos_part)
+    return angles
+
+def vertex_contributions(vertices, chunk_faces, mode, face_normals=None):
+    """
+    Contributions d'un bloc de faces aux normales de leurs sommets.
+
+    :return: Tuple (indices des sommets (3K,), contributions pondérées (3K, 3)).
+    """
+    corners = vertices[chunk_faces].astype(np.float64, copy=False)
+    v0, v1, v2 = corners[:, 0], corners[:, 1], corners[:, 2]
+
+    if mode == "area" or face_normals is None:
+        # Le produit vectoriel brut a pour norme deux fois l'aire de la face
+        normals = cross_product_batch(v1 - v0, v2 - v0)
+        if mode != "area":
+            vector_normalize_batch(normals, out=normals)
+    else:
+        normals = np.asarray(face_normals, dtype=np.float64)
+
+    if mode == "angle":
+        weights = _corner_angles(v0, v1, v2)
+    else:
+        weights = np.ones((len(chunk_faces), 3))
+
+    contributions = weights[:, :, np.newaxis] * normals[:, np.newaxis, :]
+    return chunk_faces.ravel(), contributions.reshape(-1, 3)
+
+def compute_vertex_normals_array(vertices, faces, mode="uniform", face_normals=None,
+                                 dtype=np.float64, chunk_size=1 << 22):
+    """
+    Calcule la normale de chaque sommet en accumulant les normales des faces adjacentes
+    (addition par np.bincount sur les indices de sommets), puis en normalisant.
+
+    :param vertices: Sommets (V, 3).
+    :param faces: Indices des sommets de chaque face (F, 3).
+    :param mode: Pondération des faces : "uniform" (moyenne simple), "area" (par l'aire de la face)
+                 ou "angle" (par l'angle de la face au sommet).
+    :param face_normals: Normales unitaires des faces (F, 3) déjà calculées (optionnel).
+    :param dtype: Type flottant du tableau retourné.
+    :param chunk_size: Nombre de faces traitées par bloc.
+    :return: Normales unitaires des sommets (V, 3) ; nulles pour un sommet sans face.
+    """
+    if mode not in VERTEX_NORMAL_MODES:
+        raise ValueError(f"mode de pondération inconnu : {mode!r} (attendu : {', '.join(VERTEX_NORMAL_MODES)})")
+    vertices = np.asarray(vertices)
+    faces = np.asarray(faces)
+    vertex_count = len(vertices)
+    accumulated = np.zeros((vertex_count, 3), dtype=np.float64)
+
+    for start, stop in iter_face_chunks(len(faces), chunk_size):
+        chunk_faces = faces[start:stop]
+        chunk_normals = None if face_normals is None else face_normals[start:stop]
+        indices, contributions = vertex_contributions(vertices, chunk_faces, mode, chunk_normals)
+        for axis in range(3):
+            accumulated[:, axis] += np.bincount(indices, contributions[:, axis], minlength=vertex_count)
+
+    return vector_normalize_batch(accumulated).astype(dtype, copy=False)
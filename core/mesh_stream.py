@@ -0,0 +1,222 @@
+import os
+import sys
+from itertools import islice
+
+import numpy as np
+
+from core.mesh_normals import VERTEX_NORMAL_MODES, vertex_contributions
+from core.ply_io import PLY_FORMATS, face_property, field_view, read_ply_header
+from core.vector_math import cross_product_batch, vector_normalize_batch
+
+OUTPUT_FILES = ("face_centers.npy", "face_normals.npy", "vertex_normals.npy")
+
+class PlyStream:
+    """
+    Lecture par blocs d'un fichier PLY à faces triangulaires, sans le charger en mémoire.
+
+    Les sommets sont accessibles par une projection mémoire (vertices, lecture seule) : le fichier
+    lui-même en binaire, une copie .npy dans work_dir en ASCII. Les faces ne sont jamais projetées :
+    iter_faces les lit par blocs de taille fixe (lectures explicites), si bien que la mémoire utilisée
+    dépend de la taille des blocs et non du nombre de faces.
+
+    :param file_path: Chemin du fichier PLY.
+    :param work_dir: Répertoire des fichiers temporaires (sommets d'un fichier ASCII).
+    """
+
+    def __init__(self, file_path, work_dir=None):
+        self.file_path = file_path
+        with open(file_path, "rb") as file:
+            self.format, self.elements, self._data_offset = read_ply_header(file)
+        names = [element.name for element in self.elements]
+        if "vertex" not in names:
+            raise ValueError("fichier PLY sans élément vertex")
+        self._vertex = self.elements[names.index("vertex")]
+        self._face = self.elements[names.index("face")] if "face" in names else None
+        self.vertex_count = self._vertex.count
+        self.face_count = self._face.count if self._face is not None else 0
+
+        if self.format == "ascii":
+            self.vertices = self._ascii_vertices(work_dir or os.path.dirname(os.path.abspath(file_path)))
+        else:
+            byte_order = PLY_FORMATS[self.format]
+            offset = self._data_offset
+            for element in self.elements:
+                if element.list_properties and (element.name != "face" or len(element.list_properties) != 1):
+                    raise ValueError(f"élément '{element.name}' non pris en charge (liste de longueur variable)")
+                dtype = element.dtype(byte_order)
+                if element is self._vertex:
+                    records = np.memmap(file_path, dtype=dtype, mode="r", offset=offset, shape=(element.count,))
+                    self.vertices = field_view(records, ["x", "y", "z"])
+                elif element is self._face:
+                    self._face_offset, self._face_dtype = offset, dtype
+                offset += dtype.itemsize * element.count
+
+    def _ascii_vertices(self, work_dir, chunk_size=1 << 20):
+        """Copie les sommets d'un fichier ASCII, par blocs, dans un .npy projeté en mémoire."""
+        if self._vertex.list_properties or (self._face is not None and len(self._face.properties) != 1):
+            raise ValueError("fichier PLY ASCII non pris en charge en lecture par blocs (propriétés de liste)")
+        names = [name for name, _ in self._vertex.properties]
+        columns = [names.index(axis) for axis in "xyz"]
+        # Même type que read_ply (type de la propriété x du fichier)
+        dtype = self._vertex.dtype("=")["x"]
+        path = os.path.join(work_dir, f".{os.path.basename(self.file_path)}.vertices.npy")
+        vertices = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(self.vertex_count, 3))
+        for start, lines in self._iter_ascii_lines(self._vertex, chunk_size):
+            values = np.array(b" ".join(lines).split(), dtype=np.float64).reshape(len(lines), -1)
+            vertices[start:start + len(lines)] = values[:, columns]
+        vertices.flush()
+        del vertices
+        self._vertices_path = path
+        return np.load(path, mmap_mode="r")
+
+    def _iter_ascii_lines(self, target, chunk_size):
+        """Parcourt les lignes de l'élément target d'un fichier ASCII, par blocs de chunk_size lignes."""
+        with open(self.file_path, "rb") as file:
+            file.seek(self._data_offset)
+            for element in self.elements:
+                for start in range(0, element.count, chunk_size):
+                    lines = list(islice(file, min(chunk_size, element.count - start)))
+                    if len(lines) != min(chunk_size, element.count - start):
+                        raise ValueError(f"fichier PLY tronqué (élément '{element.name}')")
+                    if element is target:
+                        yield start, lines
+                if element is target:
+                    return
+
+    def iter_faces(self, chunk_size=1 << 20):
+        """
+        Lit les faces par blocs.
+
+        :param chunk_size: Nombre de faces par bloc.
+        :return: Générateur de tuples (indice de la première face, faces du bloc (K, 3)).
+        """
+        if self._face is None:
+            return
+        if self.format == "ascii":
+            for start, lines in self._iter_ascii_lines(self._face, chunk_size):
+                values = np.array(b" ".join(lines).split(), dtype=np.int64)
+                if len(values) != 4 * len(lines) or np.any(values[::4] != 3):
+                    raise ValueError("seules les faces triangulaires sont prises en charge")
+                yield start, values.reshape(-1, 4)[:, 1:]
+            return
+
+        indices = face_property(self._face_dtype.names)
+        with open(self.file_path, "rb") as file:
+            file.seek(self._face_offset)
+            for start in range(0, self.face_count, chunk_size):
+                count = min(chunk_size, self.face_count - start)
+                records = np.fromfile(file, dtype=self._face_dtype, count=count)
+                if len(records) != count:
+                    raise ValueError("fichier PLY tronqué (élément 'face')")
+                if np.any(records[indices + "_count"] != 3):
+                    raise ValueError("seules les faces triangulaires sont prises en charge")
+                yield start, records[indices]
+
+    def close(self):
+        """Libère les projections mémoire et supprime la copie temporaire des sommets (fichier ASCII)."""
+        self.vertices = None
+        path = getattr(self, "_vertices_path", None)
+        if path is not None and os.path.exists(path):
+            os.remove(path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def iter_face_normals(stream, chunk_size=1 << 20, dtype=np.float64):
+    """
+    Calcule les centres et normales des faces au fil de la lecture, bloc par bloc.
+
+    :param stream: PlyStream ouvert.
+    :return: Générateur de tuples (indice de la première face, faces (K, 3), centres (K, 3), normales unitaires (K, 3)).
+    """
+    for start, faces in stream.iter_faces(chunk_size):
+        corners = stream.vertices[faces].astype(dtype, copy=False)
+        v0, v1, v2 = corners[:, 0], corners[:, 1], corners[:, 2]
+        normals = vector_normalize_batch(cross_product_batch(v1 - v0, v2 - v0))
+        centers = (v0 + v1 + v2) / 3
+        yield start, faces, centers, normals
+
+def _accumulate(accumulator, indices, contributions):
+    """Ajoute des contributions à un accumulateur projeté en mémoire, sans tableau temporaire de taille V."""
+    touched, inverse = np.unique(indices, return_inverse=True)
+    sums = np.empty((len(touched), 3))
+    for axis in range(3):
+        sums[:, axis] = np.bincount(inverse.reshape(-1), contributions[:, axis], minlength=len(touched))
+    accumulator[touched] += sums
+
+class _NpyWriter:
+    """Écriture séquentielle d'un tableau .npy (N, 3) de taille connue, bloc par bloc, sans le garder en mémoire."""
+
+    def __init__(self, path, dtype, length):
+        self.dtype = np.dtype(dtype)
+        self.file = open(path, "wb")
+        np.lib.format.write_array_header_1_0(self.file, {
+            "descr": np.lib.format.dtype_to_descr(self.dtype), "fortran_order": False, "shape": (length, 3)})
+
+    def write(self, chunk):
+        self.file.write(np.ascontiguousarray(chunk, dtype=self.dtype).tobytes())
+
+    def close(self):
+        self.file.close()
+
+def stream_mesh_normals(file_path, output_dir, mode="uniform", chunk_size=1 << 20, dtype=np.float64):
+    """
+    Calcule les centres et normales des faces et les normales des sommets d'un fichier PLY sans le charger
+    en mémoire : les faces sont lues par blocs de chunk_size, les résultats écrits au fur et à mesure dans
+    des fichiers .npy (OUTPUT_FILES) écrits séquentiellement, et les normales des sommets accumulées dans leur
+    fichier de sortie projeté en mémoire, puis normalisées par blocs. La mémoire utilisée dépend de chunk_size,
+    pas de la taille du mesh. Les résultats sont ceux de compute_face_normals_array et
+    compute_vertex_normals_array sur le mesh entier.
+
+    :param file_path: Chemin du fichier PLY.
+    :param output_dir: Répertoire de sortie (créé si besoin).
+    :param mode: Pondération des normales des sommets ("uniform", "area" ou "angle").
+    :param chunk_size: Nombre de faces (ou de sommets) traités par bloc.
+    :param dtype: Type flottant des tableaux écrits.
+    :return: Tuple (centres des faces (F, 3), normales des faces (F, 3), normales des sommets (V, 3)),
+             projetés en mémoire en lecture seule.
+    """
+    if mode not in VERTEX_NORMAL_MODES:
+        raise ValueError(f"mode de pondération inconnu : {mode!r} (attendu : {', '.join(VERTEX_NORMAL_MODES)})")
+    os.makedirs(output_dir, exist_ok=True)
+    paths = [os.path.join(output_dir, name) for name in OUTPUT_FILES]
+
+    with PlyStream(file_path, output_dir) as stream:
+        centers = _NpyWriter(paths[0], dtype, stream.face_count)
+        face_normals = _NpyWriter(paths[1], dtype, stream.face_count)
+        # Accumulateur en float64 dans le fichier de sortie, converti à la fin si besoin
+        accumulator_path = paths[2] if dtype == np.float64 else paths[2] + ".tmp.npy"
+        accumulator = np.lib.format.open_memmap(accumulator_path, mode="w+", dtype=np.float64,
+                                                shape=(stream.vertex_count, 3))
+
+        try:
+            for _, faces, chunk_centers, chunk_normals in iter_face_normals(stream, chunk_size):
+                centers.write(chunk_centers)
+                face_normals.write(chunk_normals)
+                indices, contributions = vertex_contributions(stream.vertices, faces, mode, chunk_normals)
+                _accumulate(accumulator, indices, contributions)
+        finally:
+            centers.close()
+            face_normals.close()
+
+        if accumulator_path == paths[2]:
+            vertex_normals = accumulator
+        else:
+            vertex_normals = np.lib.format.open_memmap(paths[2], mode="w+", dtype=dtype,
+                                                       shape=(stream.vertex_count, 3))
+        for start in range(0, stream.vertex_count, chunk_size):
+            stop = min(start + chunk_size, stream.vertex_count)
+            vertex_normals[start:stop] = vector_normalize_batch(np.asarray(accumulator[start:stop]))
+        vertex_normals.flush()
+        del vertex_normals, accumulator
+        if accumulator_path != paths[2]:
+            os.remove(accumulator_path)
+
+    return tuple(np.load(path, mmap_mode="r") for path in paths)
+
+if __name__ == "__main__":
+    # Utilisation : python -m core.mesh_stream mesh.ply répertoire_de_sortie [mode]
+    stream_mesh_normals(sys.argv[1], sys.argv[2], *sys.argv[3:4])
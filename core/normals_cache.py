@@ -0,0 +1,125 @@
+import hashlib
+import os
+import shutil
+
+import numpy as np
+
+from core.mesh_normals import compute_face_normals_array, compute_vertex_normals_array
+
+# Version du format du cache : à incrémenter si le calcul des normales change
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "OMM_NORMALS_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "omm-normals"))
+DEFAULT_MAX_BYTES = 2 << 30
+
+CACHE_FILES = ("face_centers.npy", "face_normals.npy", "vertex_normals.npy")
+
+def mesh_content_hash(vertices, faces, *extra, chunk_rows=1 << 20):
+    """
+    Empreinte (blake2b, hexadécimale) du contenu d'un mesh : types, formes et données des
+    sommets et des faces, plus les paramètres supplémentaires extra. Les tableaux sont lus
+    par blocs de chunk_rows lignes (pas de copie complète pour les vues non contiguës).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (np.asarray(vertices), np.asarray(faces)):
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        for start in range(0, len(array), chunk_rows):
+            digest.update(np.ascontiguousarray(array[start:start + chunk_rows]).data)
+    for value in extra:
+        digest.update(repr(value).encode())
+    return digest.hexdigest()
+
+def cache_key(content_key, *extra):
+    """
+    Nom d'une entrée du cache : empreinte du contenu du mesh (mesh_content_hash), calculée une
+    seule fois et partagée par les différents caches, combinée aux paramètres du calcul extra.
+    """
+    digest = hashlib.blake2b(content_key.encode(), digest_size=16)
+    for value in extra:
+        digest.update(repr(value).encode())
+    return digest.hexdigest()
+
+def _entry_size(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+def prune_cache(cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, keep=()):
+    """
+    Supprime les entrées les moins récemment utilisées du cache jusqu'à ce que sa taille
+    totale ne dépasse plus max_bytes. Les entrées dont le nom est dans keep sont conservées.
+    """
+    if not os.path.isdir(cache_dir):
+        return
+    entries = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if os.path.isdir(path) and not name.startswith("."):
+            entries.append((os.path.getmtime(path), _entry_size(path), name, path))
+    total = sum(size for _, size, _, _ in entries)
+    for _, size, name, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if name in keep:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
+
+def load_entry(path, names=CACHE_FILES):
+    """Projette en mémoire les tableaux d'une entrée du cache, ou retourne None si elle est absente ou illisible."""
+    try:
+        arrays = tuple(np.load(os.path.join(path, name), mmap_mode="r") for name in names)
+    except (OSError, ValueError):
+        return None
+    # Marque l'entrée comme récemment utilisée (ordre LRU)
+    os.utime(path)
+    return arrays
+
+def store_entry(path, arrays, names=CACHE_FILES):
+    """Écrit les tableaux d'une entrée du cache (un fichier .npy par nom)."""
+    temporary = f"{path}.tmp-{os.getpid()}"
+    os.makedirs(temporary, exist_ok=True)
+    try:
+        for name, array in zip(names, arrays):
+            np.save(os.path.join(temporary, name), array)
+        # Renommage atomique : une entrée n'est jamais visible partiellement écrite
+        os.rename(temporary, path)
+    except OSError:
+        shutil.rmtree(temporary, ignore_errors=True)
+
+def load_or_compute_normals(vertices, faces, mode="uniform", cache_dir=DEFAULT_CACHE_DIR,
+                            max_bytes=DEFAULT_MAX_BYTES, content_key=None):
+    """
+    Retourne les centres et normales des faces et les normales des sommets d'un mesh, lus
+    depuis le cache disque s'ils ont déjà été calculés pour le même contenu et le même mode,
+    sinon calculés puis enregistrés. Les tableaux lus depuis le cache sont projetés en
+    mémoire (mmap, lecture seule).
+
+    :param vertices: Sommets (V, 3).
+    :param faces: Faces triangulaires (F, 3).
+    :param mode: Pondération des normales des sommets ("uniform", "area" ou "angle").
+    :param cache_dir: Répertoire du cache (None : pas de cache).
+    :param max_bytes: Taille maximale du cache ; les entrées les plus anciennes sont supprimées.
+    :param content_key: Empreinte mesh_content_hash(vertices, faces) déjà calculée (sinon calculée ici).
+    :return: Tuple (centres des faces (F, 3), normales des faces (F, 3), normales des sommets (V, 3)).
+    """
+    key = None
+    if cache_dir is not None:
+        if content_key is None:
+            content_key = mesh_content_hash(vertices, faces)
+        key = cache_key(content_key, mode, CACHE_VERSION)
+        path = os.path.join(cache_dir, key)
+        if os.path.isdir(path):
+            arrays = load_entry(path)
+            if arrays is not None:
+                return arrays
+            shutil.rmtree(path, ignore_errors=True)
+
+    centers, face_normals = compute_face_normals_array(vertices, faces)
+    vertex_normals = compute_vertex_normals_array(vertices, faces, mode, face_normals=face_normals)
+    arrays = (centers, face_normals, vertex_normals)
+
+    if key is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        store_entry(os.path.join(cache_dir, key), arrays)
+        prune_cache(cache_dir, max_bytes, keep=(key,))
+    return arrays
@@ -0,0 +1,158 @@
+import numpy as np
+
+from core.vector_math import as_vector_array, cross_product, cross_product_batch, to_vector3_list, vector3
+
+# Codes de virage (signe de la composante y du produit vectoriel AB x BC)
+TURN_HORAIRE = -1
+TURN_COLINEAIRE = 0
+TURN_ANTI_HORAIRE = 1
+
+# Libellés indexés par code + 1
+TURN_LABELS = ("Horaire", "Colinéaire", "Anti-horaire")
+
+def turn_label(code):
+    """Retourne le libellé correspondant à un code de virage."""
+    return TURN_LABELS[int(code) + 1]
+
+def check_turn_direction(a, b, c):
+    """Calcule le produit vectoriel pour déterminer la direction de rotation."""
+    AB = vector3(b.x-a.x, b.y-a.y, b.z-a.z)
+    BC = vector3(c.x-b.x, c.y-b.y, c.z-b.z)
+
+    cross_AB_BC = cross_product(AB, BC)
+
+    if cross_AB_BC.y > 0:
+        return cross_AB_BC, "Anti-horaire"
+    elif cross_AB_BC.y < 0:
+        return cross_AB_BC, "Horaire"
+    else:
+        return cross_AB_BC, "Colinéaire"
+
+def check_turn_directions(points):
+    """
+    Calcule en une passe la direction de rotation de chaque point intérieur d'un chemin.
+    Équivaut à appeler check_turn_direction(points[i-1], points[i], points[i+1]) pour tout i.
+
+    :param points: Chemin sous forme de tableau (N, 3) ou de liste de Vector3.
+    :return: Tuple (produits vectoriels (N-2, 3), codes de virage int8 (N-2,)).
+    """
+    points = as_vector_array(points)
+    if len(points) < 3:
+        return np.empty((0, 3), dtype=points.dtype), np.empty(0, dtype=np.int8)
+
+    edges = np.diff(points, axis=0)
+    crosses = cross_product_batch(edges[:-1], edges[1:])
+    codes = np.sign(crosses[:, 1]).astype(np.int8)
+    return crosses, codes
+
+def turn_labels(codes):
+    """Convertit un tableau de codes de virage en liste de libellés."""
+    return [TURN_LABELS[code + 1] for code in np.asarray(codes, dtype=np.int64).tolist()]
+
+class PathAnalysis:
+    """
+    Analyse mémorisée des virages d'un chemin : produits vectoriels, codes, libellés
+    et positions d'ancrage des libellés (les points intérieurs du chemin).
+
+    Le résultat est calculé une seule fois puis mis à jour uniquement lorsque le chemin
+    est modifié via append, extend ou set_point ; un ajout ne recalcule que la fin du chemin.
+    """
+
+    def __init__(self, points=()):
+        self._points = np.empty((0, 3), dtype=np.float64)
+        self._crosses = np.empty((0, 3), dtype=np.float64)
+        self._codes = np.empty(0, dtype=np.int8)
+        self._size = 0
+        self._labels = []
+        self._anchor_vectors = []
+        self.extend(points)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def points(self):
+        """Points du chemin (N, 3)."""
+        return self._points[:self._size]
+
+    @property
+    def crosses(self):
+        """Produits vectoriels AB x BC de chaque point intérieur (N-2, 3)."""
+        return self._crosses[:max(self._size - 2, 0)]
+
+    @property
+    def codes(self):
+        """Codes de virage int8 de chaque point intérieur (N-2,)."""
+        return self._codes[:max(self._size - 2, 0)]
+
+    @property
+    def labels(self):
+        """Libellés de virage de chaque point intérieur."""
+        return self._labels
+
+    @property
+    def anchors(self):
+        """Positions 3D des libellés (N-2, 3)."""
+        return self.points[1:-1]
+
+    @property
+    def anchor_vectors(self):
+        """Positions des libellés sous forme de Vector3, prêtes à être dessinées (créées au premier accès)."""
+        count = max(self._size - 2, 0)
+        built = len(self._anchor_vectors)
+        if built < count:
+            self._anchor_vectors.extend(to_vector3_list(self._points[built + 1:count + 1]))
+        return self._anchor_vectors
+
+    def _reserve(self, size):
+        """Agrandit les tableaux internes (capacité doublée) pour contenir size points."""
+        capacity = len(self._points)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 16)
+        points = np.empty((capacity, 3), dtype=np.float64)
+        points[:self._size] = self._points[:self._size]
+        crosses = np.empty((capacity, 3), dtype=np.float64)
+        crosses[:len(self._crosses)] = self._crosses
+        codes = np.empty(capacity, dtype=np.int8)
+        codes[:len(self._codes)] = self._codes
+        self._points, self._crosses, self._codes = points, crosses, codes
+
+    def _update_turns(self, start, stop):
+        """Recalcule les virages d'indices [start, stop) (virage i centré sur le point i + 1)."""
+        start = max(start, 0)
+        stop = min(stop, self._size - 2)
+        if start >= stop:
+            return
+        crosses, codes = check_turn_directions(self._points[start:stop + 2])
+        self._crosses[start:stop] = crosses
+        self._codes[start:stop] = codes
+
+        # Les nouveaux virages sont ajoutés en fin de liste, les autres remplacés
+        self._labels[start:stop] = turn_labels(codes)
+        # Les Vector3 d'ancrage sont recréés à la demande à partir de start
+        del self._anchor_vectors[start:]
+
+    def append(self, point):
+        """Ajoute un point en fin de chemin et calcule uniquement le nouveau virage."""
+        self.extend([point])
+
+    def extend(self, points):
+        """Ajoute plusieurs points en fin de chemin et calcule uniquement les nouveaux virages."""
+        points = as_vector_array(points)
+        if len(points) == 0:
+            return
+        old_size = self._size
+        self._reserve(old_size + len(points))
+        self._points[old_size:old_size + len(points)] = points
+        self._size += len(points)
+        self._update_turns(old_size - 2, self._size - 2)
+
+    def set_point(self, index, point):
+        """Déplace un point du chemin et recalcule les trois virages qui en dépendent."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("indice de point hors du chemin")
+        self._points[index] = as_vector_array([point])[0]
+        self._update_turns(index - 2, index + 1)
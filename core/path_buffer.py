@@ -0,0 +1,121 @@
+import numpy as np
+
+from core.vector_math import as_vector_array, to_vector3_list
+
+# Directions élémentaires d'un chemin sur grille (même ordre que dans generate_maze_path)
+DIRECTIONS = np.array([(1, 0, 0), (-1, 0, 0), (0, 0, 1), (0, 0, -1), (0, 1, 0), (0, -1, 0)], dtype=np.int8)
+
+class PathBuffer:
+    """
+    Chemin stocké dans un tampon float32 contigu (N, 3), agrandi par doublement de capacité.
+    Remplace une liste de Vector3 (une allocation cffi par point).
+    """
+
+    def __init__(self, points=(), capacity=0):
+        self._data = np.empty((capacity, 3), dtype=np.float32)
+        self._size = 0
+        self.extend(points)
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        return self.array[index]
+
+    def __iter__(self):
+        return iter(self.array)
+
+    @property
+    def array(self):
+        """Vue (N, 3) sur les points du chemin (sans copie)."""
+        return self._data[:self._size]
+
+    @property
+    def nbytes(self):
+        return self._size * 3 * self._data.itemsize
+
+    def _reserve(self, size):
+        capacity = len(self._data)
+        if size > capacity:
+            data = np.empty((max(size, 2 * capacity, 64), 3), dtype=np.float32)
+            data[:self._size] = self._data[:self._size]
+            self._data = data
+
+    def append(self, point):
+        """Ajoute un point en fin de chemin."""
+        self.extend([point])
+
+    def extend(self, points):
+        """Ajoute des points (tableau (K, 3) ou liste de Vector3) en fin de chemin."""
+        points = as_vector_array(points, dtype=np.float32)
+        self._reserve(self._size + len(points))
+        self._data[self._size:self._size + len(points)] = points
+        self._size += len(points)
+
+    def shrink_to_fit(self):
+        """Libère la capacité inutilisée."""
+        self._data = self._data[:self._size].copy()
+
+    def to_vector3_list(self):
+        """Convertit le chemin en liste de Vector3 (pour les fonctions de dessin)."""
+        return to_vector3_list(self.array)
+
+class DirectionPath:
+    """
+    Chemin sur grille codé par son point de départ et un code de direction int8 par segment
+    (indice dans DIRECTIONS) : un octet par segment au lieu de trois flottants par point.
+    """
+
+    def __init__(self, start, codes=(), longueur_segment=1.0):
+        self.start = as_vector_array([start])[0]
+        self.longueur_segment = float(longueur_segment)
+        self._codes = np.empty(0, dtype=np.int8)
+        self._size = 0
+        self.extend_codes(codes)
+
+    def __len__(self):
+        """Nombre de points du chemin."""
+        return self._size + 1
+
+    @property
+    def codes(self):
+        """Codes de direction (N - 1,)."""
+        return self._codes[:self._size]
+
+    @classmethod
+    def from_points(cls, points, longueur_segment=1.0):
+        """
+        Code un chemin dont chaque segment suit un axe et mesure longueur_segment.
+        Le chemin doit avoir au moins un point (son départ), contrairement à un PathBuffer.
+        """
+        points = as_vector_array(points)
+        if not len(points):
+            raise ValueError("un chemin codé par directions a besoin d'au moins un point de départ")
+        steps = np.diff(points, axis=0)
+        # Direction élémentaire la plus proche de chaque pas, puis vérification du pas lui-même
+        # (avant tout arrondi : un pas hors grille ou trop long n'est jamais recodé)
+        codes = np.argmax(steps @ DIRECTIONS.T, axis=1).astype(np.int8)
+        if not np.allclose(steps, DIRECTIONS[codes] * longueur_segment, rtol=0, atol=1e-3 * abs(longueur_segment)):
+            raise ValueError("le chemin contient un segment qui ne suit pas la grille")
+        return cls(points[0], codes, longueur_segment)
+
+    def extend_codes(self, codes):
+        """Ajoute des segments à partir de leurs codes de direction."""
+        codes = np.asarray(codes, dtype=np.int8)
+        if len(codes) and (codes.min() < 0 or codes.max() >= len(DIRECTIONS)):
+            raise ValueError("code de direction invalide")
+        size = self._size + len(codes)
+        if size > len(self._codes):
+            grown = np.empty(max(size, 2 * len(self._codes), 64), dtype=np.int8)
+            grown[:self._size] = self._codes[:self._size]
+            self._codes = grown
+        self._codes[self._size:size] = codes
+        self._size = size
+
+    def to_points(self, dtype=np.float32):
+        """Décode le chemin en tableau (N, 3) de points."""
+        points = np.empty((self._size + 1, 3), dtype=dtype)
+        points[0] = self.start
+        np.cumsum(DIRECTIONS[self.codes] * self.longueur_segment, axis=0, out=points[1:])
+        points[1:] += self.start
+        return points
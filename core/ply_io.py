@@ -0,0 +1,252 @@
+import mmap
+import sys
+from itertools import islice
+
+import numpy as np
+
+# Types scalaires PLY -> types NumPy (sans ordre des octets)
+PLY_TYPES = {
+    "char": "i1", "int8": "i1", "uchar": "u1", "uint8": "u1",
+    "short": "i2", "int16": "i2", "ushort": "u2", "uint16": "u2",
+    "int": "i4", "int32": "i4", "uint": "u4", "uint32": "u4",
+    "float": "f4", "float32": "f4", "double": "f8", "float64": "f8",
+}
+
+PLY_FORMATS = {"ascii": None, "binary_little_endian": "<", "binary_big_endian": ">"}
+
+class PlyElement:
+    """Description d'un élément d'en-tête PLY (vertex, face, ...) et de ses propriétés."""
+
+    def __init__(self, name, count):
+        self.name = name
+        self.count = count
+        self.properties = []    # (nom, type) ou (nom, (type du compteur, type des valeurs))
+
+    @property
+    def list_properties(self):
+        return [name for name, kind in self.properties if isinstance(kind, tuple)]
+
+    def dtype(self, byte_order, list_length=3):
+        """Type structuré d'un enregistrement, les listes étant supposées de longueur list_length."""
+        fields = []
+        for name, kind in self.properties:
+            if isinstance(kind, tuple):
+                count_type, item_type = kind
+                fields.append((name + "_count", byte_order + PLY_TYPES[count_type]))
+                fields.append((name, byte_order + PLY_TYPES[item_type], (list_length,)))
+            else:
+                fields.append((name, byte_order + PLY_TYPES[kind]))
+        return np.dtype(fields)
+
+def read_ply_header(file):
+    """
+    Lit l'en-tête d'un fichier PLY ouvert en binaire.
+
+    :return: Tuple (format, liste de PlyElement, taille de l'en-tête en octets).
+    """
+    if file.readline().strip() != b"ply":
+        raise ValueError("fichier PLY invalide : signature 'ply' absente")
+    fmt = None
+    elements = []
+    while True:
+        line = file.readline()
+        if not line:
+            raise ValueError("fichier PLY invalide : 'end_header' absent")
+        words = line.decode("ascii", errors="replace").split()
+        if not words or words[0] in ("comment", "obj_info"):
+            continue
+        if words[0] == "end_header":
+            break
+        if words[0] == "format":
+            if words[1] not in PLY_FORMATS:
+                raise ValueError(f"format PLY non pris en charge : {words[1]}")
+            fmt = words[1]
+        elif words[0] == "element":
+            elements.append(PlyElement(words[1], int(words[2])))
+        elif words[0] == "property":
+            if words[1] == "list":
+                elements[-1].properties.append((words[4], (words[2], words[3])))
+            else:
+                elements[-1].properties.append((words[2], words[1]))
+    if fmt is None:
+        raise ValueError("fichier PLY invalide : format absent")
+    return fmt, elements, file.tell()
+
+def field_view(records, names):
+    """
+    Vue (N, len(names)) sur des champs consécutifs de même type d'un tableau structuré,
+    sans copie ; copie en dernier recours si les champs ne sont pas contigus.
+    """
+    fields = [records.dtype.fields[name] for name in names]
+    base_type, base_offset = fields[0][0], fields[0][1]
+    contiguous = all(field[0] == base_type and field[1] == base_offset + i * base_type.itemsize
+                     for i, field in enumerate(fields))
+    if not contiguous:
+        return np.stack([records[name] for name in names], axis=1)
+    return np.ndarray((len(records), len(names)), dtype=base_type, buffer=records,
+                      offset=base_offset, strides=(records.dtype.itemsize, base_type.itemsize))
+
+class PlyMesh:
+    """
+    Mesh lu depuis un fichier PLY. En binaire, vertices et faces sont des vues NumPy en
+    lecture seule sur une projection mémoire (mmap) du fichier : aucune donnée n'est copiée
+    ni lue avant d'être utilisée.
+
+    Attributs : vertices (V, 3), faces (F, 3), elements (tableaux structurés par élément).
+    """
+
+    def __init__(self, elements, fmt, mapping=None):
+        self.format = fmt
+        self.elements = elements
+        self._mmap = mapping
+        vertex = elements["vertex"]
+        self.vertices = field_view(vertex, ["x", "y", "z"])
+        face = elements.get("face")
+        if face is None:
+            self.faces = np.empty((0, 3), dtype=np.int32)
+        else:
+            self.faces = face[face_property(face.dtype.names)]
+
+    @property
+    def edges(self):
+        """
+        Arêtes de chaque face (3F, 2), dans le même ordre que trimesh (mesh.edges) : une arête partagée
+        apparaît une fois par face. Voir core.mesh_adjacency.MeshAdjacency pour les arêtes uniques.
+        """
+        return self.faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+
+    def close(self):
+        """Libère la projection mémoire (les vues deviennent invalides)."""
+        self.vertices = self.faces = None
+        self.elements = {}
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def face_property(names):
+    """Nom de la propriété de liste des indices de sommets d'un élément face."""
+    for name in ("vertex_indices", "vertex_index"):
+        if name in names:
+            return name
+    raise ValueError("élément face sans propriété vertex_indices")
+
+def _read_binary(file, fmt, elements, offset, validate):
+    mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        byte_order = PLY_FORMATS[fmt]
+        arrays = {}
+        for element in elements:
+            lists = element.list_properties
+            if lists and (element.name != "face" or len(lists) != 1):
+                raise ValueError(f"élément '{element.name}' non pris en charge (liste de longueur variable)")
+            dtype = element.dtype(byte_order)
+            if offset + dtype.itemsize * element.count > len(mapping):
+                raise ValueError(f"fichier PLY tronqué (élément '{element.name}')")
+            records = np.frombuffer(mapping, dtype=dtype, count=element.count, offset=offset)
+            if lists and element.count:
+                counts = records[lists[0] + "_count"]
+                # Contrôle en O(1) : premières et dernières faces ; validate vérifie toutes les faces
+                checked = counts if validate else counts[[0, -1]]
+                if np.any(checked != 3):
+                    raise ValueError("seules les faces triangulaires sont prises en charge")
+            arrays[element.name] = records
+            offset += dtype.itemsize * element.count
+        if offset != len(mapping) and elements[-1].name == "face":
+            # Des faces non triangulaires décaleraient la fin des données
+            raise ValueError("taille de fichier incohérente : faces non triangulaires ?")
+    except BaseException:
+        # Les vues numpy sur la projection doivent disparaître avant de pouvoir la fermer
+        arrays = records = counts = checked = None
+        mapping.close()
+        raise
+    return PlyMesh(arrays, fmt, mapping)
+
+def _read_ascii(file, elements):
+    arrays = {}
+    for element in elements:
+        lines = list(islice(file, element.count))
+        if len(lines) != element.count:
+            raise ValueError(f"fichier PLY tronqué (élément '{element.name}')")
+        dtype = element.dtype("=")
+        widths = [dtype.fields[name][0].shape[0] if dtype.fields[name][0].shape else 1 for name in dtype.names]
+        values = np.array(b" ".join(lines).split(), dtype=np.float64)
+        if len(values) != element.count * sum(widths):
+            raise ValueError(f"élément '{element.name}' non pris en charge (listes de longueur variable)")
+        values = values.reshape(element.count, -1)
+        records = np.empty(element.count, dtype=dtype)
+        column = 0
+        for name, width in zip(dtype.names, widths):
+            records[name] = values[:, column:column + width].reshape(records[name].shape)
+            column += width
+        for name in element.list_properties:
+            if element.count and np.any(records[name + "_count"] != 3):
+                raise ValueError("seules les faces triangulaires sont prises en charge")
+        arrays[element.name] = records
+    return PlyMesh(arrays, "ascii")
+
+def read_ply(file_path, validate=False):
+    """
+    Lit un fichier PLY (ascii, binary_little_endian ou binary_big_endian) à faces triangulaires.
+    En binaire, les tableaux retournés sont des vues sur une projection mémoire du fichier
+    (ouverture quasi instantanée, quelle que soit la taille) ; en ASCII, le fichier est analysé.
+
+    :param file_path: Chemin du fichier PLY.
+    :param validate: En binaire, vérifie que chaque face a trois sommets (lit alors toutes les faces).
+    :return: PlyMesh (attributs vertices et faces).
+    """
+    with open(file_path, "rb") as file:
+        fmt, elements, offset = read_ply_header(file)
+        if not any(element.name == "vertex" for element in elements):
+            raise ValueError("fichier PLY sans élément vertex")
+        if fmt == "ascii":
+            return _read_ascii(file, elements)
+        return _read_binary(file, fmt, elements, offset, validate)
+
+def write_ply_binary(file_path, vertices, faces, vertex_records=None):
+    """
+    Écrit un mesh dans un fichier PLY binary_little_endian (faces : 'property list uchar int vertex_indices').
+
+    :param vertices: Sommets (V, 3), écrits en float, si vertex_records n'est pas fourni.
+    :param faces: Faces triangulaires (F, 3).
+    :param vertex_records: Tableau structuré des propriétés des sommets à conserver telles quelles (optionnel).
+    """
+    if vertex_records is None:
+        vertices = np.asarray(vertices, dtype="<f4")
+        vertex_records = np.empty(len(vertices), dtype=[("x", "<f4"), ("y", "<f4"), ("z", "<f4")])
+        vertex_records["x"], vertex_records["y"], vertex_records["z"] = vertices.T
+    vertex_records = vertex_records.astype(vertex_records.dtype.newbyteorder("<"))
+    ply_names = {np.dtype(t).str[1:]: name for name, t in reversed(list(PLY_TYPES.items()))}
+
+    face_records = np.empty(len(faces), dtype=[("count", "u1"), ("vertex_indices", "<i4", (3,))])
+    face_records["count"] = 3
+    face_records["vertex_indices"] = faces
+
+    header = ["ply", "format binary_little_endian 1.0", f"element vertex {len(vertex_records)}"]
+    header += [f"property {ply_names[vertex_records.dtype.fields[name][0].str[1:]]} {name}"
+               for name in vertex_records.dtype.names]
+    header += [f"element face {len(face_records)}", "property list uchar int vertex_indices", "end_header"]
+    with open(file_path, "wb") as file:
+        file.write(("\n".join(header) + "\n").encode("ascii"))
+        file.write(vertex_records.tobytes())
+        file.write(face_records.tobytes())
+
+def convert_ply_to_binary(source_path, target_path):
+    """
+    Convertit un fichier PLY (ASCII notamment) en binary_little_endian, lisible ensuite sans copie
+    par read_ply. Les propriétés des sommets sont conservées ; seuls les sommets et les faces sont écrits.
+    """
+    mesh = read_ply(source_path)
+    try:
+        write_ply_binary(target_path, None, mesh.faces, vertex_records=mesh.elements["vertex"])
+    finally:
+        mesh.close()
+
+if __name__ == "__main__":
+    # Utilisation : python -m core.ply_io source.ply cible.ply
+    convert_ply_to_binary(sys.argv[1], sys.argv[2])
@@ -0,0 +1,166 @@
+import math
+
+import numpy as np
+
+# Plans de coupe utilisés par raylib (RL_CULL_DISTANCE_NEAR / RL_CULL_DISTANCE_FAR)
+CULL_DISTANCE_NEAR = 0.01
+CULL_DISTANCE_FAR = 1000.0
+
+# Valeur de camera.projection pour une caméra orthographique (pr.CAMERA_ORTHOGRAPHIC)
+CAMERA_ORTHOGRAPHIC = 1
+
+def _xyz(vector):
+    return np.array([vector.x, vector.y, vector.z], dtype=np.float64)
+
+def camera_state(camera):
+    """Paramètres d'une caméra sous forme de tuple comparable, pour savoir si elle a bougé d'une image à l'autre."""
+    return (camera.position.x, camera.position.y, camera.position.z,
+            camera.target.x, camera.target.y, camera.target.z,
+            camera.up.x, camera.up.y, camera.up.z,
+            camera.fovy, camera.projection)
+
+def look_at_matrix(eye, target, up):
+    """
+    Calcule la matrice de vue (4, 4) d'une caméra, comme MatrixLookAt de raylib.
+
+    :param eye: Position de la caméra (3,).
+    :param target: Point visé (3,).
+    :param up: Direction du haut (3,).
+    :return: Matrice (4, 4) à appliquer à des vecteurs colonnes homogènes.
+    """
+    eye = np.asarray(eye, dtype=np.float64)
+    z_axis = eye - np.asarray(target, dtype=np.float64)
+    z_axis /= np.linalg.norm(z_axis) or 1.0
+    x_axis = np.cross(np.asarray(up, dtype=np.float64), z_axis)
+    x_axis /= np.linalg.norm(x_axis) or 1.0
+    y_axis = np.cross(z_axis, x_axis)
+
+    view = np.eye(4)
+    view[0, :3], view[1, :3], view[2, :3] = x_axis, y_axis, z_axis
+    view[:3, 3] = -view[:3, :3] @ eye
+    return view
+
+def perspective_matrix(fovy, aspect, near=CULL_DISTANCE_NEAR, far=CULL_DISTANCE_FAR):
+    """
+    Calcule la matrice de projection perspective (4, 4), comme MatrixPerspective de raylib.
+
+    :param fovy: Champ de vision vertical en degrés.
+    :param aspect: Rapport largeur / hauteur de l'écran.
+    """
+    top = near * math.tan(math.radians(fovy) / 2)
+    right = top * aspect
+    projection = np.zeros((4, 4))
+    projection[0, 0] = near / right
+    projection[1, 1] = near / top
+    projection[2, 2] = -(far + near) / (far - near)
+    projection[2, 3] = -2 * far * near / (far - near)
+    projection[3, 2] = -1
+    return projection
+
+def orthographic_matrix(fovy, aspect, near=CULL_DISTANCE_NEAR, far=CULL_DISTANCE_FAR):
+    """Calcule la matrice de projection orthographique (4, 4) ; fovy est la hauteur visible."""
+    top = fovy / 2
+    right = top * aspect
+    projection = np.eye(4)
+    projection[0, 0] = 1 / right
+    projection[1, 1] = 1 / top
+    projection[2, 2] = -2 / (far - near)
+    projection[2, 3] = -(far + near) / (far - near)
+    return projection
+
+def frustum_planes(view_projection):
+    """
+    Extrait les six plans du volume de vue d'une matrice vue-projection (méthode de Gribb et Hartmann).
+
+    :return: Tableau (6, 4) de plans (a, b, c, d) normalisés, orientés vers l'intérieur :
+             un point p est dans le volume si a*x + b*y + c*z + d >= 0 pour les six plans.
+    """
+    m = np.asarray(view_projection, dtype=np.float64)
+    planes = np.stack([
+        m[3] + m[0], m[3] - m[0],  # gauche, droite
+        m[3] + m[1], m[3] - m[1],  # bas, haut
+        m[3] + m[2], m[3] - m[2],  # proche, lointain
+    ])
+    planes /= np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+    return planes
+
+def project_to_screen(points, view_projection, width, height):
+    """
+    Projette des points 3D (N, 3) à l'écran avec une matrice vue-projection, comme GetWorldToScreenEx
+    de raylib, en une seule multiplication matricielle.
+
+    :param points: Points (N, 3).
+    :param view_projection: Matrice vue-projection (4, 4).
+    :param width: Largeur de l'écran en pixels.
+    :param height: Hauteur de l'écran en pixels.
+    :return: (positions à l'écran (N, 2), booléens (N,) vrais pour les points devant la caméra
+             et dans les limites de l'écran).
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    m = np.asarray(view_projection, dtype=np.float64)
+    clip = points @ m[:, :3].T + m[:, 3]
+    w = clip[:, 3]
+    in_front = w > 0
+    w = np.where(in_front, w, 1.0)
+    screen = np.empty((len(points), 2))
+    screen[:, 0] = (clip[:, 0] / w + 1) / 2 * width
+    screen[:, 1] = (1 - clip[:, 1] / w) / 2 * height
+    visible = (in_front & (screen[:, 0] >= 0) & (screen[:, 0] <= width)
+               & (screen[:, 1] >= 0) & (screen[:, 1] <= height))
+    return screen, visible
+
+class Frustum:
+    """
+    Volume de vue d'une caméra pour une image : matrice vue-projection, plans de coupe
+    et position de l'œil, calculés en numpy (sans appel à raylib).
+    """
+
+    def __init__(self, eye, view_projection, orthographic=False, direction=None):
+        self.eye = np.asarray(eye, dtype=np.float64)
+        self.matrix = np.asarray(view_projection, dtype=np.float64)
+        self.planes = frustum_planes(self.matrix)
+        self.orthographic = orthographic
+        self.direction = direction
+
+    @classmethod
+    def from_camera(cls, camera, aspect):
+        """
+        Construit le volume de vue d'une caméra pyray (Camera3D), avec les mêmes matrices que raylib.
+
+        :param camera: Caméra utilisée pour le dessin.
+        :param aspect: Rapport largeur / hauteur de l'écran.
+        """
+        eye, target, up = _xyz(camera.position), _xyz(camera.target), _xyz(camera.up)
+        orthographic = camera.projection == CAMERA_ORTHOGRAPHIC
+        if orthographic:
+            projection = orthographic_matrix(camera.fovy, aspect)
+        else:
+            projection = perspective_matrix(camera.fovy, aspect)
+        direction = target - eye
+        direction /= np.linalg.norm(direction) or 1.0
+        return cls(eye, projection @ look_at_matrix(eye, target, up), orthographic, direction)
+
+    def project(self, points, width, height):
+        """Projette des points (N, 3) à l'écran (voir project_to_screen)."""
+        return project_to_screen(points, self.matrix, width, height)
+
+    def contains_points(self, points):
+        """Indique, pour chaque point (N, 3), s'il est dans le volume de vue."""
+        points = np.asarray(points)
+        distances = points @ self.planes[:, :3].T + self.planes[:, 3]
+        return (distances >= 0).all(axis=1)
+
+    def boxes_outside(self, mins, maxs):
+        """
+        Indique, pour chaque boîte englobante alignée sur les axes, si elle est entièrement hors du volume.
+        Test conservateur : une boîte qui coupe le volume n'est jamais rejetée.
+
+        :param mins: Coins minimaux (N, 3).
+        :param maxs: Coins maximaux (N, 3).
+        :return: Tableau de booléens (N,).
+        """
+        normals = self.planes[:, :3]
+        # Pour chaque plan, le sommet de la boîte le plus loin dans la direction de la normale
+        farthest = np.where(normals[np.newaxis] >= 0, maxs[:, np.newaxis], mins[:, np.newaxis])
+        distances = np.einsum("npk,pk->np", farthest, normals) + self.planes[:, 3]
+        return (distances < 0).any(axis=1)
@@ -0,0 +1,67 @@
+from core.draw_backend import get_backend
+from core.labels import LABEL_STATS
+from core.vector_math import vector_length, vector_normalize
+
+def initialize_camera():
+    """Initialise la caméra 3D."""
+    pr = get_backend()
+    camera = pr.Camera3D(
+        pr.Vector3(0, 10, 10),  # position
+        pr.Vector3(0, 0, 0),    # cible
+        pr.Vector3(0, 1, 0),    # haut
+        45,                     # fovy (champ de vision dans la direction y)
+        pr.CAMERA_PERSPECTIVE
+    )
+    return camera
+
+def update_camera_position(camera, movement_speed):
+    """Met à jour la position de la caméra en fonction des touches pressées."""
+    pr = get_backend()
+    if pr.is_key_down(pr.KEY_W):
+        camera.position.z -= movement_speed
+    if pr.is_key_down(pr.KEY_S):
+        camera.position.z += movement_speed
+    if pr.is_key_down(pr.KEY_A):
+        camera.position.x -= movement_speed
+    if pr.is_key_down(pr.KEY_D):
+        camera.position.x += movement_speed
+    if pr.is_key_down(pr.KEY_Q):
+        camera.position.y += movement_speed
+    if pr.is_key_down(pr.KEY_E):
+        camera.position.y -= movement_speed
+
+def draw_vector_3(start, end, color, thickness=0.05, head_size_factor=0.8):
+    """Dessine un vecteur en utilisant un cylindre et un cône."""
+    pr = get_backend()
+    direction = pr.Vector3(end.x - start.x, end.y - start.y, end.z - start.z)
+    length = vector_length(direction)
+    head_size = length * head_size_factor
+
+    n_direction = vector_normalize(direction)
+
+    arrow_start = pr.Vector3(start.x + n_direction.x * head_size,
+                             start.y + n_direction.y * head_size,
+                             start.z + n_direction.z * head_size)
+
+    pr.draw_cylinder_ex(start, end, thickness / 2, thickness / 2, 8, color)
+    pr.draw_cylinder_ex(arrow_start, end, thickness * 2, thickness / 5, 8, color)
+
+def draw_text_if_visible_3(camera, text, position_3d, font_size=20, color=None):
+    """
+    Affiche le texte à une position 2D projetée à partir d'une coordonnée 3D si elle est dans les limites de l'écran.
+    Un texte hors écran est seulement compté (LABEL_STATS). Pour de nombreux libellés, utiliser core.labels.draw_labels.
+
+    :param camera: La caméra utilisée pour la projection.
+    :param text: Texte à afficher.
+    :param position_3d: Position 3D du texte.
+    :param font_size: Taille de la police du texte.
+    :param color: Couleur du texte (noir par défaut).
+    """
+    pr = get_backend()
+    color = pr.BLACK if color is None else color
+    text_position_2d = pr.get_world_to_screen(position_3d, camera)
+    if 0 <= text_position_2d.x <= pr.get_screen_width() and 0 <= text_position_2d.y <= pr.get_screen_height():
+        pr.draw_text(text, int(text_position_2d.x), int(text_position_2d.y), font_size, color)
+        LABEL_STATS.record(1, 0)
+    else:
+        LABEL_STATS.record(0, 1)
@@ -0,0 +1,174 @@
+import math
+
+import numpy as np
+
+from core.fov import is_point_in_fov_batch
+from core.vector_math import as_vector_array
+
+class UniformGrid:
+    """
+    Index spatial par grille uniforme : chaque point est rangé dans la cellule cubique
+    de côté cell_size qui le contient. Les requêtes (rayon, cône de FOV) ne testent que
+    les points des cellules proches, leur coût dépend donc du nombre de points voisins
+    et non de la population totale.
+
+    Les points sont identifiés par l'entier retourné par insert ; ils peuvent être
+    déplacés (move) ou supprimés (remove) individuellement.
+    """
+
+    def __init__(self, cell_size=1.0):
+        if cell_size <= 0:
+            raise ValueError("cell_size doit être strictement positif")
+        self.cell_size = float(cell_size)
+        self._positions = np.empty((0, 3), dtype=np.float64)
+        self._cells = {}      # cellule (i, j, k) -> ensemble d'identifiants
+        self._cell_of = []    # identifiant -> cellule (None si supprimé)
+        self._free_ids = []
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, point_id):
+        return 0 <= point_id < len(self._cell_of) and self._cell_of[point_id] is not None
+
+    def _cell_key(self, point):
+        size = self.cell_size
+        return (math.floor(point[0] / size), math.floor(point[1] / size), math.floor(point[2] / size))
+
+    def _reserve(self, size):
+        capacity = len(self._positions)
+        if size > capacity:
+            positions = np.empty((max(size, 2 * capacity, 64), 3), dtype=np.float64)
+            positions[:capacity] = self._positions
+            self._positions = positions
+
+    def position(self, point_id):
+        """Retourne la position (3,) d'un point de l'index."""
+        if point_id not in self:
+            raise KeyError(point_id)
+        return self._positions[point_id].copy()
+
+    def insert(self, point):
+        """Ajoute un point et retourne son identifiant."""
+        return int(self.insert_many([point])[0])
+
+    def insert_many(self, points):
+        """Ajoute plusieurs points (tableau (N, 3)) et retourne leurs identifiants."""
+        points = as_vector_array(points)
+        ids = np.empty(len(points), dtype=np.int64)
+        # Réutilise d'abord les identifiants libérés, puis en crée de nouveaux
+        reused = min(len(self._free_ids), len(points))
+        for i in range(reused):
+            ids[i] = self._free_ids.pop()
+        new_count = len(points) - reused
+        first_new = len(self._cell_of)
+        ids[reused:] = np.arange(first_new, first_new + new_count)
+        self._reserve(first_new + new_count)
+        self._cell_of.extend([None] * new_count)
+
+        self._positions[ids] = points
+        keys = np.floor(points / self.cell_size).astype(np.int64).tolist()
+        for point_id, key in zip(ids.tolist(), keys):
+            key = tuple(key)
+            self._cells.setdefault(key, set()).add(point_id)
+            self._cell_of[point_id] = key
+        self._count += len(points)
+        return ids
+
+    def move(self, point_id, point):
+        """Déplace un point ; seule sa cellule est mise à jour si elle change."""
+        old_key = self._cell_of[point_id] if point_id in self else None
+        if old_key is None:
+            raise KeyError(point_id)
+        point = as_vector_array([point])[0]
+        self._positions[point_id] = point
+        key = self._cell_key(point)
+        if key != old_key:
+            self._discard(old_key, point_id)
+            self._cells.setdefault(key, set()).add(point_id)
+            self._cell_of[point_id] = key
+
+    def remove(self, point_id):
+        """Supprime un point de l'index."""
+        key = self._cell_of[point_id] if point_id in self else None
+        if key is None:
+            raise KeyError(point_id)
+        self._discard(key, point_id)
+        self._cell_of[point_id] = None
+        self._free_ids.append(point_id)
+        self._count -= 1
+
+    def _discard(self, key, point_id):
+        bucket = self._cells[key]
+        bucket.discard(point_id)
+        if not bucket:
+            del self._cells[key]
+
+    def _candidate_cells(self, center, radius):
+        """Cellules (C, 3) intersectant la boîte englobante de la sphère (center, radius)."""
+        low = np.floor((center - radius) / self.cell_size).astype(np.int64)
+        high = np.floor((center + radius) / self.cell_size).astype(np.int64)
+        spans = high - low + 1
+        if np.prod(spans) > len(self._cells):
+            # Boîte plus grande que la population : on parcourt les cellules occupées
+            cells = np.array(list(self._cells), dtype=np.int64).reshape(-1, 3)
+            return cells[np.all((cells >= low) & (cells <= high), axis=1)]
+        axes = [np.arange(l, h + 1) for l, h in zip(low, high)]
+        return np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+
+    def _gather(self, cells):
+        """Retourne les identifiants des points contenus dans les cellules données."""
+        ids = []
+        buckets = self._cells
+        for key in map(tuple, cells.tolist()):
+            bucket = buckets.get(key)
+            if bucket:
+                ids.extend(bucket)
+        return np.array(ids, dtype=np.int64)
+
+    def _cells_near(self, center, radius):
+        """Cellules dont la sphère englobante intersecte la sphère (center, radius)."""
+        cells = self._candidate_cells(center, radius)
+        centers = (cells + 0.5) * self.cell_size
+        cell_radius = self.cell_size * math.sqrt(3) / 2
+        dist = np.linalg.norm(centers - center, axis=1)
+        return cells[dist <= radius + cell_radius]
+
+    def query_radius(self, center, radius):
+        """Retourne les identifiants des points à une distance inférieure ou égale à radius de center."""
+        center = as_vector_array([center])[0]
+        cells = self._cells_near(center, radius)
+        ids = self._gather(cells)
+        to_points = self._positions[ids] - center
+        dist_sq = np.einsum("ij,ij->i", to_points, to_points)
+        return ids[dist_sq <= radius * radius]
+
+    def query_fov(self, fov_position, fov_direction, fov_distance, fov_angle):
+        """
+        Retourne les identifiants des points dans le champ de vision (même test que is_point_in_fov).
+        Les cellules entièrement hors du secteur (distance ou angle) sont écartées avant le test par point.
+        """
+        position = as_vector_array([fov_position])[0]
+        direction = as_vector_array([fov_direction])[0]
+        cells = self._candidate_cells(position, fov_distance)
+        if len(cells) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # Rejet des cellules : sphère englobante trop loin ou hors du cône élargi
+        centers = (cells + 0.5) * self.cell_size - position
+        cell_radius = self.cell_size * math.sqrt(3) / 2
+        dist = np.linalg.norm(centers, axis=1)
+        keep = dist <= fov_distance + cell_radius
+        length = np.linalg.norm(direction)
+        half_angle = math.radians(min(fov_angle, 180) / 2)
+        if length > 0 and half_angle < math.pi / 2:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cos_to_cell = (centers @ (direction / length)) / dist
+                margin = np.arcsin(np.clip(cell_radius / dist, 0, 1))
+            angle = np.arccos(np.clip(cos_to_cell, -1, 1))
+            keep &= (dist <= cell_radius) | (angle <= half_angle + margin)
+
+        ids = self._gather(cells[keep])
+        mask = is_point_in_fov_batch(position, direction, fov_distance, fov_angle, self._positions[ids])
+        return ids[mask]
@@ -0,0 +1,109 @@
+import math
+
+import numpy as np
+
+def vector3(x, y, z):
+    """
+    Construit un Vector3 pyray. pyray n'est importé qu'au premier appel, si bien que les
+    modules de core qui l'utilisent restent importables sans fenêtre ni raylib.
+    """
+    from pyray import Vector3
+    return Vector3(x, y, z)
+
+def as_vector_array(vectors, dtype=np.float64):
+    """
+    Convertit des vecteurs en tableau NumPy de forme (N, 3).
+
+    :param vectors: Tableau (N, 3) ou séquence de Vector3 / de triplets.
+    :param dtype: Type flottant du tableau retourné.
+    :return: Tableau (N, 3) (sans copie si l'entrée est déjà au bon format).
+    """
+    if isinstance(vectors, np.ndarray):
+        return np.asarray(vectors, dtype=dtype)
+    vectors = list(vectors)
+    if vectors and hasattr(vectors[0], "x"):
+        return np.array([(v.x, v.y, v.z) for v in vectors], dtype=dtype).reshape(-1, 3)
+    return np.asarray(vectors, dtype=dtype).reshape(-1, 3)
+
+def to_vector3_list(array):
+    """Convertit un tableau (N, 3) en liste de Vector3."""
+    return [vector3(x, y, z) for x, y, z in np.asarray(array, dtype=np.float64).tolist()]
+
+def cross_product_batch(A, B, out=None):
+    """
+    Calcule les produits vectoriels ligne à ligne de deux tableaux (N, 3).
+
+    :param A: Tableau (N, 3) (ou (3,)).
+    :param B: Tableau de même forme que A (ou diffusable).
+    :param out: Tableau de sortie optionnel, de forme (N, 3).
+    :return: Tableau (N, 3) des produits vectoriels A x B.
+    """
+    A = np.asarray(A)
+    B = np.asarray(B)
+    if out is None:
+        out = np.empty(np.broadcast_shapes(A.shape, B.shape), dtype=np.result_type(A, B, np.float32))
+    ax, ay, az = A[..., 0], A[..., 1], A[..., 2]
+    bx, by, bz = B[..., 0], B[..., 1], B[..., 2]
+    out[..., 0] = ay * bz - az * by
+    out[..., 1] = az * bx - ax * bz
+    out[..., 2] = ax * by - ay * bx
+    return out
+
+def dot_product_batch(A, B):
+    """Calcule les produits scalaires ligne à ligne de deux tableaux (N, 3)."""
+    A = np.asarray(A)
+    B = np.asarray(B)
+    return A[..., 0] * B[..., 0] + A[..., 1] * B[..., 1] + A[..., 2] * B[..., 2]
+
+def vector_length_batch(vectors):
+    """Calcule la longueur de chaque vecteur d'un tableau (N, 3)."""
+    vectors = np.asarray(vectors)
+    return np.sqrt(dot_product_batch(vectors, vectors))
+
+def vector_normalize_batch(vectors, out=None):
+    """
+    Normalise chaque vecteur d'un tableau (N, 3).
+    Comme vector_normalize, un vecteur de longueur nulle est retourné tel quel.
+
+    :param vectors: Tableau (N, 3) (ou (3,)).
+    :param out: Tableau de sortie optionnel (peut être vectors lui-même).
+    :return: Tableau (N, 3) de vecteurs unitaires (ou nuls).
+    """
+    vectors = np.asarray(vectors)
+    lengths = vector_length_batch(vectors)
+    # Évite la division par zéro : les vecteurs nuls sont divisés par 1
+    lengths = np.where(lengths == 0, 1, lengths)
+    return np.divide(vectors, lengths[..., np.newaxis], out=out)
+
+def cross_product(A, B):
+    """Calcule le produit croisé entre deux vecteurs A et B."""
+    return vector3(
+        A.y*B.z - A.z*B.y,
+        A.z*B.x - A.x*B.z,
+        A.x*B.y - A.y*B.x
+    )
+
+def dot_product(A, B):
+    """Calcule le produit scalaire entre deux vecteurs A et B."""
+    return A.x*B.x + A.y*B.y + A.z*B.z
+
+def vector_length(vector):
+    """Calcule la longueur d'un vecteur."""
+    return math.sqrt(dot_product(vector, vector))
+
+def vector_normalize(vector):
+    """Normalise un vecteur pour obtenir un vecteur de longueur 1."""
+    length = vector_length(vector)
+    if length == 0:
+        return vector
+    return vector3(vector.x/length, vector.y/length, vector.z/length)
+
+def rotate_vector_y(vector, angle):
+    """Fait tourner un vecteur autour de l'axe Y selon un angle donné en radians."""
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    return vector3(
+        vector.x * cos_a - vector.z * sin_a,
+        vector.y,
+        vector.x * sin_a + vector.z * cos_a
+    )
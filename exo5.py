@@ -1,177 +1,79 @@
+import numpy as np
 import pyray as pr
-import math
-from pyray import Vector3
-import trimesh
-
-def initialize_camera():
-    """Initialise la caméra 3D."""
-    camera = pr.Camera3D(
-        Vector3(0, 10, 10),  # position
-        Vector3(0, 0, 0),    # cible
-        Vector3(0, 1, 0),    # haut
-        45,                  # fovy (champ de vision dans la direction y)
-        pr.CAMERA_PERSPECTIVE
-    )
-    return camera
-
-def update_camera_position(camera, movement_speed):
-    """Met à jour la position de la caméra en fonction des touches pressées."""
-    if pr.is_key_down(pr.KEY_W):
-        camera.position.z -= movement_speed
-    if pr.is_key_down(pr.KEY_S):
-        camera.position.z += movement_speed
-    if pr.is_key_down(pr.KEY_A):
-        camera.position.x -= movement_speed
-    if pr.is_key_down(pr.KEY_D):
-        camera.position.x += movement_speed
-    if pr.is_key_down(pr.KEY_Q):
-        camera.position.y += movement_speed
-    if pr.is_key_down(pr.KEY_E):
-        camera.position.y -= movement_speed
+from core.rendering import initialize_camera, update_camera_position
+from core.mesh_normals import compute_face_normals_array, compute_vertex_normals_array
+from core.ply_io import read_ply
+from core.normals_cache import load_or_compute_normals, mesh_content_hash
+from core.mesh_buffer import GpuMesh
+from core.mesh_adjacency import MeshAdjacency
+from core.arrow_glyphs import ArrowField
+from core.culling import CullingHierarchy, default_chunk_size, morton_order
+from core.projection import Frustum
+from core.mesh_lod import load_or_build_lod_pyramid
+from core.frame_profiler import FrameProfiler
 
 def load_ply_file(file_path):
-    """Charge un fichier PLY et retourne le mesh en tant que structure de données trimesh."""
-    mesh = trimesh.load(file_path)
-    return mesh
-
-def cross_product(A, B):
-    """Calcule le produit croisé entre deux vecteurs A et B."""
-    return Vector3(
-        A.y*B.z - A.z*B.y, 
-        A.z*B.x - A.x*B.z, 
-        A.x*B.y - A.y*B.x 
-    )
-
-def vector_length(vector):
-    """Calcule la longueur d'un vecteur."""
-    return math.sqrt(dot_product(vector, vector))
-
-def vector_normalize(vector):
-    """Normalise un vecteur pour obtenir un vecteur de longueur 1."""
-    length = vector_length(vector)
-    if length==0: 
-        return vector
-    return Vector3(vector.x/length,vector.y/length,vector.z/length)
-
-def dot_product(A, B):
-    """Calcule le produit scalaire entre deux vecteurs A et B."""
-    return A.x*B.x + A.y*B.y + A.z*B.z
-
-def compute_face_center(v0, v1, v2):
-    """Calcule le centre d'une face triangulaire."""
-    return Vector3(
-        (v0.x + v1.x + v2.x) / 3,
-        (v0.y + v1.y + v2.y) / 3,
-        (v0.z + v1.z + v2.z) / 3
-    )
-
-def compute_vertex_normals(mesh, face_normals):
     """
-    Calcule les normales pour chaque sommet en moyennant les normales des faces adjacentes.
-    Retourne un dictionnaire avec chaque sommet et son vecteur normal associé.
+    Charge un fichier de mesh. Les fichiers PLY sont lus par read_ply (PlyMesh, avec projection
+    mémoire pour les fichiers binaires) ; les autres formats passent par trimesh.
+    Le mesh retourné expose vertices, faces et edges.
     """
-    
-    # TODO : mettre en œuvre le calcul des normales pour chaque sommet 
-    # en moyennant les normales des faces adjacentes
-    vertex_normals = {i: Vector3(0, 0, 0) for i in range(len(mesh.vertices))}
-    vertex_count = {i: 0 for i in range(len(mesh.vertices))}
-
-    for face, (_, normal) in zip(mesh.faces, face_normals):
-        for vertex_index in face:
-            vertex_normals[vertex_index].x += normal.x
-            vertex_normals[vertex_index].y += normal.y
-            vertex_normals[vertex_index].z += normal.z
-            vertex_count[vertex_index] += 1
+    if file_path.lower().endswith(".ply"):
+        return read_ply(file_path)
+    import trimesh
+    return trimesh.load(file_path)
 
-    # TODO : Moyenne les normales (n'oubliez pas de normaliser)
-    for i in vertex_normals:
-        if vertex_count[i] > 0:
-            # TODO : 
-            vertex_normals[i] = vector_normalize(vertex_normals[i])
-            # TODO: Normalisation
+def compute_vertex_normals(mesh, face_normals, mode="uniform"):
+    """
+    Calcule les normales pour chaque sommet en moyennant les normales des faces adjacentes.
+    Retourne un tableau (V, 3) des normales des sommets.
 
-    return vertex_normals
+    :param mode: Pondération des faces adjacentes : "uniform", "area" ou "angle".
+    """
+    _, normals = face_normals
+    return compute_vertex_normals_array(mesh.vertices, mesh.faces, mode, face_normals=normals)
 
 def compute_face_normals(mesh):
-    """Calcule les normales pour chaque face du mesh et retourne une liste de tuples (centre, normale)."""
-    normals = []
-    for face in mesh.faces:
-        v0 = Vector3(*mesh.vertices[face[0]])
-        v1 = Vector3(*mesh.vertices[face[1]])
-        v2 = Vector3(*mesh.vertices[face[2]])
-
-        # TODO : Calculer le vecteur normal de la face
-        edge1 = Vector3(v1.x-v0.x, v1.y-v0.y, v1.z-v0.z) # TODO
-        edge2 = Vector3(v2.x-v0.x, v2.y-v0.y, v2.z-v0.z) # TODO
-        normal = cross_product(edge1, edge2)
-        normal = vector_normalize(normal)
-
-        # Calculer le centre de la face
-        center = compute_face_center(v0, v1, v2)
-        
-        normals.append((center, normal))
-    return normals
-
-def draw_vertex_normals(mesh, vertex_normals):
     """
-    Dessine les normales des sommets comme des vecteurs à partir de chaque sommet.
+    Calcule le centre et la normale de chaque face du mesh (calcul vectorisé sur ses tableaux de sommets et de faces).
+    Retourne un tuple (centres (F, 3), normales unitaires (F, 3)).
     """
-    for vertex_index, normal in vertex_normals.items():
-        start_point = Vector3(*mesh.vertices[vertex_index])
-        end_point = Vector3(
-            start_point.x + normal.x * 0.5,
-            start_point.y + normal.y * 0.5,
-            start_point.z + normal.z * 0.5
-        )
-        draw_vector_3(start_point, end_point, pr.GREEN)  # Dessine le vecteur normal en vert
-
-def draw_vector_3(start, end, color, thickness=0.05, head_size_factor=0.8):
-    """Dessine un vecteur en utilisant un cylindre et un cône."""
-    direction = Vector3(end.x - start.x, end.y - start.y, end.z - start.z)
-    length = vector_length(direction)
-    head_size = length * head_size_factor
-    
-    n_direction = vector_normalize(direction)
-    
-    arrow_start = Vector3(start.x + n_direction.x * head_size, 
-                          start.y + n_direction.y * head_size, 
-                          start.z + n_direction.z * head_size)
-    
-    pr.draw_cylinder_ex(start, end, thickness / 2, thickness / 2, 8, color)
-    pr.draw_cylinder_ex(arrow_start, end, thickness * 2, thickness / 5, 8, color)
+    return compute_face_normals_array(mesh.vertices, mesh.faces)
 
-def draw_edge(start, end, color, thickness=0.05):
-    """Dessine une arête comme un cylindre."""
-    pr.draw_cylinder_ex(start, end, thickness / 2, thickness / 2, 8, color)
-
-def draw_mesh(mesh):
-    """Dessine le mesh complet avec sommets, arêtes et faces."""
-    # Dessine les faces sous forme de triangles
-    for face in mesh.faces:
-        v0 = Vector3(*mesh.vertices[face[0]])
-        v1 = Vector3(*mesh.vertices[face[1]])
-        v2 = Vector3(*mesh.vertices[face[2]])
-        pr.draw_triangle_3d(v0, v1, v2, pr.LIGHTGRAY)  # Dessine la face comme un triangle rempli
-    
-    # Dessine les arêtes
-    for edge in mesh.edges:
-        v_start = Vector3(*mesh.vertices[edge[0]])
-        v_end = Vector3(*mesh.vertices[edge[1]])
-        draw_edge(v_start, v_end, pr.BLACK)  # Dessine l'arête
-    
-    # Dessine les sommets
-    for vertex in mesh.vertices:
-        pr.draw_sphere(Vector3(*vertex), 0.05, pr.RED)  # Dessine les sommets comme de petites sphères
-
-def draw_face_normals(face_normals):
-    """Dessine les normales des faces comme des vecteurs à partir du centre de chaque face."""
-    for center, normal in face_normals:
-        end_point = Vector3(
-            center.x + normal.x * 0.5,  # Échelle de la normale pour la visualisation
-            center.y + normal.y * 0.5,
-            center.z + normal.z * 0.5
-        )
-        draw_vector_3(center, end_point, pr.BLUE)  # Dessine le vecteur normal
+def prepare_level(lod):
+    """
+    Prépare le dessin d'un niveau de détail (LodLevel) : faces et sommets ordonnés le long d'une courbe
+    de Morton puis découpés en blocs compacts (pour écarter à chaque image les blocs hors champ ou vus de dos),
+    envoyés une seule fois au GPU avec les flèches des normales.
+    Les arêtes sont dessinées à part, une seule fois chacune (arêtes uniques de MeshAdjacency), dans un tampon
+    de segments découpé en blocs selon leur propre hiérarchie de culling.
+    Retourne un tuple (gpu_mesh, face_culling, vertex_culling, edge_culling, face_normal_arrows,
+    vertex_normal_arrows, edge_lines).
+    """
+    face_order = morton_order(lod.face_centers)
+    faces_per_chunk = default_chunk_size(len(lod.faces))
+    face_culling = CullingHierarchy.from_faces(lod.vertices, lod.faces, lod.face_normals, face_order,
+                                               chunk_size=faces_per_chunk, padding=0.5)
+    vertex_order = morton_order(lod.vertices)
+    vertices_per_chunk = default_chunk_size(len(lod.vertices))
+    vertex_culling = CullingHierarchy.from_points(lod.vertices, lod.vertex_normals, vertex_order,
+                                                  chunk_size=vertices_per_chunk, padding=0.5)
+    gpu_mesh = GpuMesh(lod.vertices, lod.faces, face_normals=lod.face_normals, faces_per_chunk=faces_per_chunk,
+                       face_order=face_order, vertex_order=vertex_order, vertices_per_chunk=vertices_per_chunk)
+    face_normal_arrows = ArrowField(lod.face_centers[face_order], lod.face_normals[face_order] * 0.5,
+                                    segments=face_culling.chunk_starts)
+    vertex_normal_arrows = ArrowField(lod.vertices[vertex_order], lod.vertex_normals[vertex_order] * 0.5,
+                                      segments=vertex_culling.chunk_starts)
+    edges = MeshAdjacency(lod.faces, len(lod.vertices)).edges
+    edge_starts, edge_ends = lod.vertices[edges[:, 0]], lod.vertices[edges[:, 1]]
+    edge_order = morton_order((edge_starts + edge_ends) / 2)
+    edge_starts, edge_ends = edge_starts[edge_order], edge_ends[edge_order]
+    edge_culling = CullingHierarchy(np.minimum(edge_starts, edge_ends), np.maximum(edge_starts, edge_ends),
+                                    chunk_size=default_chunk_size(len(edges)))
+    edge_lines = ArrowField(edge_starts, edge_ends - edge_starts, max_arrows=None, style="lines",
+                            segments=edge_culling.chunk_starts)
+    return (gpu_mesh, face_culling, vertex_culling, edge_culling, face_normal_arrows, vertex_normal_arrows,
+            edge_lines)
 
 def main():
     pr.init_window(800, 600, "PLY Viewer with Normals")
@@ -181,25 +83,58 @@ def main():
 
     # Charge et affiche le fichier PLY
     ply_file_path = "dolphin.ply"  # Remplacez par le chemin de votre fichier PLY
+    profiler = FrameProfiler.from_env()
     mesh = load_ply_file(ply_file_path)
-    face_normals = compute_face_normals(mesh)
-    vertex_normals = compute_vertex_normals(mesh, face_normals)
+    # Les normales et les niveaux de détail sont relus depuis le cache disque si le mesh n'a pas changé
+    with profiler.scope("normals"):
+        # Une seule lecture complète du mesh pour l'empreinte, partagée par les deux caches
+        content_key = mesh_content_hash(mesh.vertices, mesh.faces)
+        normals = load_or_compute_normals(mesh.vertices, mesh.faces, content_key=content_key)
+        pyramid = load_or_build_lod_pyramid(mesh.vertices, mesh.faces, normals=normals, content_key=content_key)
+    # Chaque niveau est préparé (et envoyé au GPU) la première fois qu'il est affiché
+    levels = {}
 
     while not pr.window_should_close():
-        update_camera_position(camera, movement_speed)
+        with profiler.scope("camera"):
+            update_camera_position(camera, movement_speed)
+            # Niveau le plus simple dont l'erreur reste sous un pixel à la distance de la caméra
+            level = pyramid.select(camera.position, camera.fovy, pr.get_screen_height())
+        if level not in levels:
+            levels[level] = prepare_level(pyramid[level])
+        (gpu_mesh, face_culling, vertex_culling, edge_culling, face_normal_arrows, vertex_normal_arrows,
+         edge_lines) = levels[level]
         pr.begin_drawing()
         pr.clear_background(pr.RAYWHITE)
-        pr.begin_mode_3d(camera)
-        
-        draw_mesh(mesh)              # Affiche les sommets, arêtes et faces du fichier PLY
-        draw_face_normals(face_normals)  # Affiche les normales des faces
-        draw_vertex_normals(mesh, vertex_normals)  # Affiche les normales des sommets
 
-        pr.end_mode_3d()
-        pr.end_drawing()
+        with profiler.scope("culling"):
+            frustum = Frustum.from_camera(camera, pr.get_screen_width() / pr.get_screen_height())
+            face_chunks = face_culling.visible_chunks(frustum)
+            vertex_chunks = vertex_culling.visible_chunks(frustum)
+            edge_chunks = edge_culling.visible_chunks(frustum)
+
+        with profiler.scope("3d"):
+            pr.begin_mode_3d(camera)
 
+            # Affiche les faces, arêtes et sommets visibles du fichier PLY
+            gpu_mesh.draw(pr.LIGHTGRAY, None, pr.RED, chunks=face_chunks, point_chunks=vertex_chunks)
+            edge_lines.draw(pr.BLACK, segments=edge_chunks)  # Chaque arête une seule fois
+            face_normal_arrows.draw(pr.BLUE, segments=face_chunks)  # Affiche les normales des faces
+            vertex_normal_arrows.draw(pr.GREEN, segments=vertex_chunks)  # Affiche les normales des sommets
+
+            pr.end_mode_3d()
+
+        profiler.draw_overlay()
+        pr.end_drawing()
+        profiler.end_frame()
+
+    profiler.close()
+    for gpu_mesh, _, _, _, face_normal_arrows, vertex_normal_arrows, edge_lines in levels.values():
+        gpu_mesh.unload()
+        face_normal_arrows.unload()
+        vertex_normal_arrows.unload()
+        edge_lines.unload()
     pr.close_window()
 
 # Lancer le programme principal
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
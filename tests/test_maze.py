@@ -0,0 +1,15 @@
+import numpy as np
+
+from core.maze import generate_maze_path_array, generate_maze_paths
+
+def test_generate_maze_paths_accepte_des_graines_numpy():
+    seeds = np.arange(4, dtype=np.int64)
+    points, offsets = generate_maze_paths(seeds, 20, taille_grille=5)
+
+    expected, expected_offsets = generate_maze_paths([int(seed) for seed in seeds], 20, taille_grille=5)
+    np.testing.assert_array_equal(offsets, expected_offsets)
+    np.testing.assert_array_equal(points, expected)
+
+def test_generate_maze_path_array_accepte_une_graine_numpy():
+    np.testing.assert_array_equal(generate_maze_path_array(20, seed=np.int64(7)),
+                                  generate_maze_path_array(20, seed=7))
@@ -0,0 +1,13 @@
+import numpy as np
+import pytest
+
+from core.path_buffer import DirectionPath, PathBuffer
+
+def test_direction_path_refuse_un_chemin_vide():
+    with pytest.raises(ValueError):
+        DirectionPath.from_points(PathBuffer().array)
+
+def test_direction_path_d_un_seul_point():
+    path = DirectionPath.from_points(np.array([[1.0, 2.0, 3.0]]))
+    assert len(path) == 1
+    np.testing.assert_array_equal(path.to_points(), [[1.0, 2.0, 3.0]])